@@ -1,60 +1,276 @@
-from utils.extract import scrape_fashion
-from utils.transform import transform_to_DataFrame, transform_data
-from utils.csv_loader import load_to_csv
-from utils.database_loader import load_to_database
+import argparse
+import datetime
+import functools
+import tempfile
+
+from utils.extract import scrape_fashion_columns
+from utils.transform import (
+    transform_to_DataFrame,
+    transform_data,
+    deduplicate_products,
+    append_key_index,
+    transform_chunks,
+    spill_chunks,
+    read_spilled_chunks,
+)
+from utils.diff import load_snapshot, save_snapshot, diff_snapshots
+from utils.csv_loader import load_to_csv, load_chunks_to_csv
+from utils.database_loader import load_to_database, load_chunks_to_database
 from utils.gsheets_loader import load_to_google_sheets
+from utils.scheduler import run_scheduler, run_once
+from utils.profiler import enable_profiling, disable_profiling, profile_stage
 
-def main():
+def main(changes_only=False, archive_dir=None, replay_dir=None, replay_at=None):
     """
     Run the ETL (Extract, Transform, Load) pipeline for fashion product data.
 
     This function performs the following steps:
-        1. Scrape product data from the source URL.
+        1. Scrape product data from the source URL (or replay it from an
+           archive) into per-column lists.
         2. Convert the scraped data into a pandas DataFrame.
         3. Transform the DataFrame (clean values, convert prices, parse ratings, etc.).
-        4. Print the transformed DataFrame.
-        5. Save the DataFrame into a CSV file.
-        6. Save the DataFrame into Database.
-        7. Save the DataFrame into Google Spreadsheets
+        4. Compare with the previous snapshot and save the change feed into CSV.
+        5. Print the transformed DataFrame.
+        6. Find products not seen in previous runs (skipped with `changes_only`).
+        7. Save the full DataFrame (or the change feed) into a CSV file.
+        8. Save new products (or the change feed) into Database.
+        9. Save the full DataFrame (or the change feed, into the "Changes"
+           sheet) into Google Spreadsheets.
+        10. Mark new products as seen once the Database load succeeded, and
+            save the snapshot once the change feed was stored by all of its
+            loaders.
+
+    Each stage is wrapped in `profile_stage`, which only records CPU and
+    allocation profiles when profiling is enabled (see `--profile`).
 
     If an error occurs at any stage, the function will catch it and print
     an error message without stopping the program.
 
     Args:
-        None
+        changes_only (bool, optional): Load only the change feed instead
+            of the full DataFrame. Defaults to False.
+        archive_dir (str | None, optional): Archive every fetched page
+            here. Defaults to None.
+        replay_dir (str | None, optional): Read pages from this archive
+            instead of the website. Defaults to None.
+        replay_at (datetime.datetime | None, optional): Replay the pages
+            fetched at or before this time. Defaults to None (latest).
 
     Returns:
-        None
+        bool: True if every loader succeeded, False if no data was scraped,
+        a loader failed or the pipeline raised an error.
     """
     BASE_URL = "https://fashion-studio.dicoding.dev/"
+    KEY_INDEX_FILE = "product_keys.npy"
+    SNAPSHOT_FILE = "products_snapshot.pkl"
+    CHANGES_FILE = "product_changes.csv"
+    CHANGES_SHEET = "Changes"
 
     try:
         # Step 1: Scrape data from the website
-        all_fashion_data = scrape_fashion(BASE_URL)
+        all_fashion_data = scrape_fashion_columns(
+            BASE_URL, archive_dir=archive_dir, replay_dir=replay_dir, replay_at=replay_at
+        )
+
+        if all_fashion_data and all_fashion_data["Title"]:
+            with profile_stage("transform"):
+                # Step 2: Convert data into DataFrame
+                df = transform_to_DataFrame(all_fashion_data)
 
-        if all_fashion_data:
-            # Step 2: Convert data into DataFrame
-            df = transform_to_DataFrame(all_fashion_data)
+                # Step 3: Transform data with exchange rate
+                df = transform_data(df, exchange_rate=16000)
 
-            # Step 3: Transform data with exchange rate
-            df = transform_data(df, exchange_rate=16000)
+            # Step 4: Compare with the previous snapshot and save the change feed
+            # (the snapshot only moves forward once the feed is stored, see below)
+            with profile_stage("diff"):
+                changes = diff_snapshots(load_snapshot(SNAPSHOT_FILE), df)
+            with profile_stage("load_changes_csv"):
+                changes_saved = load_to_csv(changes, file_name=CHANGES_FILE)
 
-            # Step 4: Print transformed DataFrame
+            # Step 5: Print transformed DataFrame
             print(df)
 
-            # Step 5: Save transformed DataFrame into CSV
-            load_to_csv(df, file_name="products.csv")
+            if changes_only:
+                # Step 6: Skipped, the change feed does not touch the key index
+                # Step 7: The change feed is already saved into CSV
+
+                # Step 8: Save the change feed into Database
+                with profile_stage("load_database"):
+                    database_saved = load_to_database(changes, "product_changes")
+
+                # Step 9: Save the change feed into its own sheet (no NaN in JSON)
+                with profile_stage("load_sheets"):
+                    sheets_saved = load_to_google_sheets(
+                        changes.astype(object).where(changes.notna(), ""), sheet_name=CHANGES_SHEET
+                    )
+
+                # Step 10: Move the snapshot forward once every feed loader succeeded
+                feed_saved = changes_saved and database_saved and sheets_saved
+                if feed_saved:
+                    save_snapshot(df, SNAPSHOT_FILE)
+
+                return feed_saved
+            else:
+                # Step 6: Find products not seen in previous runs
+                with profile_stage("dedup"):
+                    new_df, new_keys = deduplicate_products(df, index_file=KEY_INDEX_FILE)
+
+                # Step 7: Save the full transformed DataFrame into CSV
+                with profile_stage("load_csv"):
+                    csv_saved = load_to_csv(df, file_name="products.csv")
+
+                # Step 8: Save new products into Database
+                with profile_stage("load_database"):
+                    database_saved = load_to_database(new_df, "product_records")
+
+                # Step 9: Save the full transformed DataFrame into Google Spreadsheets
+                # (the sheet is overwritten, so it must not get only the new products)
+                with profile_stage("load_sheets"):
+                    sheets_saved = load_to_google_sheets(df)
 
-            # Step 6: Save transformed DataFrame into Database
-            load_to_database(df, "product_records")
+                # Step 10: Mark new products as seen once the append-only Database has
+                # them, and move the snapshot forward once the change feed is saved
+                if database_saved:
+                    append_key_index(new_keys, KEY_INDEX_FILE)
+                if changes_saved:
+                    save_snapshot(df, SNAPSHOT_FILE)
 
-            # Step 7: Save transformed DataFrame into Google Spreadsheets
-            load_to_google_sheets(df)
+                return changes_saved and csv_saved and database_saved and sheets_saved
         else:
             print("No data found.")
+            return False
 
     except Exception as e:
         print(f"[ERROR] ETL pipeline failed: {e}")
+        return False
+
+def run_chunked(input_file, chunk_size=None, memory_budget=None, spill_dir=None):
+    """
+    Transform a large raw CSV or Parquet file in chunks and load it.
+
+    Use this instead of `main` when the raw data (with the scraped
+    columns Title, Price, Rating, Colors, Size, Gender and Timestamp) is
+    too large to fit in memory. The steps are:
+        1. Transform the file chunk by chunk and spill each result to disk.
+        2. Save the chunks into a CSV file.
+        3. Save the chunks into Database.
+
+    Only one chunk is held in memory at a time. Spilled chunks are
+    deleted at the end.
+
+    Args:
+        input_file (str): Path to the raw CSV or Parquet file.
+        chunk_size (int | None, optional): Rows per chunk. Defaults to None.
+        memory_budget (int | None, optional): Memory budget in bytes for one
+            chunk, used when `chunk_size` is None. Defaults to None.
+        spill_dir (str | None, optional): Parent directory for the spilled
+            chunks. Defaults to None (system temp directory).
+
+    Returns:
+        bool: True if every loader succeeded, otherwise False.
+    """
+    try:
+        with tempfile.TemporaryDirectory(dir=spill_dir) as chunk_dir:
+            # Step 1: Transform the input chunk by chunk and spill it to disk
+            with profile_stage("transform"):
+                chunks = transform_chunks(
+                    input_file, exchange_rate=16000, chunk_size=chunk_size, memory_budget=memory_budget
+                )
+                paths = spill_chunks(chunks, chunk_dir)
+
+            # Step 2: Save the chunks into CSV
+            with profile_stage("load_csv"):
+                csv_saved = load_chunks_to_csv(read_spilled_chunks(paths), file_name="products.csv")
+
+            # Step 3: Save the chunks into Database
+            with profile_stage("load_database"):
+                database_saved = load_chunks_to_database(read_spilled_chunks(paths), "product_records")
+
+        return csv_saved and database_saved
+
+    except Exception as e:
+        print(f"[ERROR] Chunked ETL pipeline failed: {e}")
+        return False
+
+def parse_args(argv=None):
+    """
+    Parse command-line options for the pipeline.
+
+    Args:
+        argv (list[str] | None, optional): Arguments to parse. Defaults to
+            None (use sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed options.
+    """
+    parser = argparse.ArgumentParser(description="Fashion products ETL pipeline")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and repeat the pipeline on an interval")
+    parser.add_argument("--interval", type=float, default=3600,
+                        help="seconds between runs in daemon mode (default: 3600)")
+    parser.add_argument("--jitter", type=float, default=60,
+                        help="maximum random delay added to each interval (default: 60)")
+    parser.add_argument("--status-file", default="etl_status.json",
+                        help="JSON file the last-run status is written to; runs are locked "
+                             "with <file>.lock so a daemon and cron runs never overlap "
+                             "(default: etl_status.json)")
+    parser.add_argument("--changes-only", action="store_true",
+                        help="load only the change feed instead of the full product data")
+    parser.add_argument("--archive", metavar="DIR",
+                        help="store every fetched page in this archive directory")
+    parser.add_argument("--replay", metavar="DIR",
+                        help="read pages from this archive directory instead of the website")
+    parser.add_argument("--replay-at", type=datetime.datetime.fromisoformat,
+                        help="replay pages fetched at or before this ISO time (default: latest)")
+    parser.add_argument("--input", metavar="FILE",
+                        help="transform a raw CSV or Parquet file in chunks instead of scraping")
+    parser.add_argument("--chunk-size", type=int,
+                        help="rows per chunk with --input (default: derived from --memory-budget)")
+    parser.add_argument("--memory-budget", type=float,
+                        help="memory budget per chunk in MB with --input (default: 50000-row chunks)")
+    parser.add_argument("--spill-dir", metavar="DIR",
+                        help="directory for spilled chunks with --input (default: system temp)")
+    parser.add_argument("--profile", metavar="DIR", nargs="?", const="profiles",
+                        help="profile each stage and write reports to DIR (default: profiles)")
+    parser.add_argument("--profile-top", type=int, default=10,
+                        help="number of allocation sites reported per stage (default: 10)")
+    return parser.parse_args(argv)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    args = parse_args()
+
+    if args.input:
+        run = functools.partial(
+            run_chunked,
+            args.input,
+            chunk_size=args.chunk_size,
+            memory_budget=int(args.memory_budget * 1024 * 1024) if args.memory_budget else None,
+            spill_dir=args.spill_dir
+        )
+    else:
+        run = functools.partial(
+            main,
+            changes_only=args.changes_only,
+            archive_dir=args.archive,
+            replay_dir=args.replay,
+            replay_at=args.replay_at
+        )
+
+    if args.profile:
+        enable_profiling(args.profile, top_n=args.profile_top)
+
+    try:
+        lock_file = f"{args.status_file}.lock"
+        if args.daemon:
+            run_scheduler(
+                run,
+                interval=args.interval,
+                jitter=args.jitter,
+                status_file=args.status_file,
+                lock_file=lock_file
+            )
+        else:
+            run_once(run, status_file=args.status_file, lock_file=lock_file)
+
+    finally:
+        disable_profiling()
\ No newline at end of file
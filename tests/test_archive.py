@@ -0,0 +1,82 @@
+import os
+import datetime
+
+from utils.archive import archive_page, load_index, read_page, find_page, iter_archive, INDEX_FILE
+
+
+# ---------- Test archive_page / read_page ----------
+def test_archive_and_read_page(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    archive_page(archive_dir, "http://example.com/", b"<html>Home</html>")
+    archive_page(archive_dir, "http://example.com/page2", b"<html>Page 2</html>")
+
+    assert read_page(archive_dir, "http://example.com/") == b"<html>Home</html>"
+    assert read_page(archive_dir, "http://example.com/page2") == b"<html>Page 2</html>"
+    assert read_page(archive_dir, "http://example.com/page3") is None
+    assert len(load_index(archive_dir)) == 2
+
+
+def test_read_page_by_fetch_time(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    url = "http://example.com/"
+    january = datetime.datetime(2025, 1, 1, 10, 0, 0)
+    february = datetime.datetime(2025, 2, 1, 10, 0, 0)
+    archive_page(archive_dir, url, b"january", fetch_time=january)
+    archive_page(archive_dir, url, b"february", fetch_time=february)
+
+    # Latest copy by default
+    assert read_page(archive_dir, url) == b"february"
+    # Latest copy at or before the requested time
+    assert find_page(archive_dir, url, fetch_time=datetime.datetime(2025, 1, 15)) == (january, b"january")
+    assert read_page(archive_dir, url, fetch_time=datetime.datetime(2024, 12, 31)) is None
+
+
+def test_read_page_missing_archive(tmp_path):
+    assert read_page(str(tmp_path / "missing"), "http://example.com/") is None
+    assert len(load_index(str(tmp_path / "missing"))) == 0
+
+
+# ---------- Test iter_archive ----------
+def test_iter_archive_slices(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    for i in range(5):
+        archive_page(archive_dir, f"http://example.com/page{i}", f"page {i}".encode())
+
+    pages = list(iter_archive(archive_dir))
+    assert [url for url, _, _ in pages] == [f"http://example.com/page{i}" for i in range(5)]
+    assert all(isinstance(fetch_time, datetime.datetime) for _, fetch_time, _ in pages)
+
+    # Disjoint slices for parallel workers
+    assert [content for _, _, content in iter_archive(archive_dir, start=3)] == [b"page 3", b"page 4"]
+    assert [content for _, _, content in iter_archive(archive_dir, stop=1)] == [b"page 0"]
+
+
+def test_load_index_ignores_torn_record(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    archive_page(archive_dir, "http://example.com/", b"<html>Home</html>")
+
+    # Simulate a crash in the middle of appending the next index record
+    with open(os.path.join(archive_dir, INDEX_FILE), "ab") as index:
+        index.write(b"\x01\x02\x03")
+
+    assert len(load_index(archive_dir)) == 1
+    assert read_page(archive_dir, "http://example.com/") == b"<html>Home</html>"
+    assert len(list(iter_archive(archive_dir))) == 1
+
+
+def test_archive_page_after_torn_record(tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    archive_page(archive_dir, "http://example.com/", b"<html>Home</html>")
+
+    # Simulate a crash in the middle of appending the next index record
+    with open(os.path.join(archive_dir, INDEX_FILE), "ab") as index:
+        index.write(b"\x01\x02\x03")
+
+    # Pages archived after the crash stay reachable
+    archive_page(archive_dir, "http://example.com/page2", b"<html>Page 2</html>")
+
+    assert len(load_index(archive_dir)) == 2
+    assert read_page(archive_dir, "http://example.com/page2") == b"<html>Page 2</html>"
+    assert [content for _, _, content in iter_archive(archive_dir)] == [
+        b"<html>Home</html>", b"<html>Page 2</html>"
+    ]
@@ -1,6 +1,6 @@
 import pandas as pd
 from unittest.mock import MagicMock, patch
-from utils.csv_loader import load_to_csv  
+from utils.csv_loader import load_to_csv, load_chunks_to_csv
 
 # ---------- Test load_to_csv ----------
 
@@ -47,4 +47,35 @@ def test_load_to_csv_exception():
     with patch.object(df, "to_csv", side_effect=Exception("Disk full")) as mock_to_csv:
         load_to_csv(df, "dummy.csv")
         mock_to_csv.assert_called_once_with("dummy.csv", index=False)
-        # The test only ensures that the exception is handled; no need to raise it.
\ No newline at end of file
+        # The test only ensures that the exception is handled; no need to raise it.
+
+# ---------- Test load_chunks_to_csv ----------
+
+def test_load_chunks_to_csv_success(tmp_path):
+    """
+    Test case for load_chunks_to_csv writing several chunks to one file.
+
+    Expected behavior:
+        - The header is written once.
+        - All rows of all chunks are saved in order.
+    """
+    file_name = str(tmp_path / "chunks.csv")
+    chunks = [pd.DataFrame({"A": [1, 2]}), pd.DataFrame({"A": [3]})]
+
+    load_chunks_to_csv(iter(chunks), file_name)
+
+    assert pd.read_csv(file_name)["A"].tolist() == [1, 2, 3]
+
+
+def test_load_chunks_to_csv_exception():
+    """
+    Test case for load_chunks_to_csv when a chunk cannot be read.
+
+    Expected behavior:
+        - The exception is caught inside `load_chunks_to_csv`.
+    """
+    def broken_chunks():
+        raise Exception("Chunk rusak")
+        yield
+
+    load_chunks_to_csv(broken_chunks(), "dummy.csv")
@@ -1,6 +1,6 @@
 import pandas as pd
 from unittest.mock import patch, MagicMock
-from utils.database_loader import load_to_database
+from utils.database_loader import load_to_database, load_chunks_to_database, get_engine, clear_engine_cache
 
 # ---------- Test load_to_database ----------
 
@@ -19,6 +19,7 @@ def test_load_to_database_success():
         3. Patch `to_sql` method of DataFrame to avoid actual DB operations.
         4. Call `load_to_database` and assert the expected calls.
     """
+    clear_engine_cache()
     df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
     table_name = "test_table"
 
@@ -41,6 +42,8 @@ def test_load_to_database_success():
             # Ensure that to_sql is called with the correct parameters
             mock_to_sql.assert_called_once_with(table_name, con=mock_connection, if_exists="append", index=False)
 
+    clear_engine_cache()
+
 
 def test_load_to_database_exception():
     """
@@ -53,10 +56,58 @@ def test_load_to_database_exception():
         - `load_to_database` should handle the exception gracefully.
         - The test passes if the exception is caught and does not propagate.
     """
+    clear_engine_cache()
     df = pd.DataFrame({"A": [1, 2]})
     table_name = "test_table"
 
     # Simulation create_engine throws an exception
     with patch("utils.database_loader.create_engine", side_effect=Exception("Koneksi gagal")):
         load_to_database(df, table_name)
-        # The test is successful if the exception is handled (not raised).
\ No newline at end of file
+        # The test is successful if the exception is handled (not raised).
+
+
+def test_get_engine_is_cached():
+    """
+    Test case for get_engine reusing the engine for the same URL.
+
+    Expected behavior:
+        - `create_engine` is called only once for repeated calls.
+        - The same engine object is returned each time.
+    """
+    clear_engine_cache()
+
+    with patch("utils.database_loader.create_engine") as mock_create_engine:
+        first = get_engine("postgresql://example")
+        second = get_engine("postgresql://example")
+
+        assert first is second
+        mock_create_engine.assert_called_once_with("postgresql://example")
+
+    clear_engine_cache()
+
+
+def test_load_chunks_to_database_success():
+    """
+    Test case for load_chunks_to_database writing every chunk.
+
+    Expected behavior:
+        - One connection is opened for all chunks.
+        - `to_sql` is called once per chunk with `if_exists="append"`.
+    """
+    clear_engine_cache()
+    chunks = [pd.DataFrame({"A": [1, 2]}), pd.DataFrame({"A": [3]})]
+
+    with patch("utils.database_loader.create_engine") as mock_create_engine:
+        mock_engine = MagicMock()
+        mock_connection = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_engine.connect.return_value.__enter__.return_value = mock_connection
+
+        with patch.object(pd.DataFrame, "to_sql", return_value=None) as mock_to_sql:
+            load_chunks_to_database(iter(chunks), "test_table")
+
+            mock_engine.connect.assert_called_once()
+            assert mock_to_sql.call_count == 2
+            mock_to_sql.assert_called_with("test_table", con=mock_connection, if_exists="append", index=False)
+
+    clear_engine_cache()
@@ -0,0 +1,91 @@
+import time
+import numpy as np
+import pandas as pd
+
+from utils.diff import diff_snapshots, load_snapshot, save_snapshot, CHANGE_COLUMNS
+
+
+def _snapshot(titles, prices, ratings):
+    return pd.DataFrame({
+        "Title": titles,
+        "Price": prices,
+        "Rating": ratings,
+        "Colors": [3] * len(titles),
+        "Size": ["M"] * len(titles),
+        "Gender": ["Men"] * len(titles),
+        "Timestamp": ["2025-01-01 10:00:00"] * len(titles),
+    })
+
+
+# ---------- Test diff_snapshots ----------
+def test_diff_snapshots_change_types():
+    previous = _snapshot(
+        ["Product A", "Product B", "Product C", "Product D", "Product E"],
+        [100000.0, 200000.0, 300000.0, 400000.0, 500000.0],
+        [4.0, 4.0, 4.0, 4.0, 4.0],
+    )
+    current = _snapshot(
+        ["Product A", "Product B", "Product C", "Product D", "Product F"],
+        [100000.0, 250000.0, 150000.0, 400000.0, 600000.0],
+        [4.0, 4.0, 4.0, 4.5, 3.0],
+    )
+
+    feed = diff_snapshots(previous, current).set_index("Title")
+
+    assert list(feed.columns) == CHANGE_COLUMNS[1:]
+    # Unchanged products are left out
+    assert "Product A" not in feed.index
+    assert feed.loc["Product B", "Change"] == "price_up"
+    assert feed.loc["Product B", "Price Change Pct"] == 25.0
+    assert feed.loc["Product C", "Change"] == "price_down"
+    assert feed.loc["Product C", "Price Change Pct"] == -50.0
+    assert feed.loc["Product D", "Change"] == "rating_change"
+    assert feed.loc["Product D", "New Rating"] == 4.5
+    assert feed.loc["Product E", "Change"] == "removed"
+    assert np.isnan(feed.loc["Product E", "New Price"])
+    assert feed.loc["Product F", "Change"] == "new"
+    assert np.isnan(feed.loc["Product F", "Old Price"])
+
+
+def test_diff_snapshots_without_previous():
+    current = _snapshot(["Product A", "Product B"], [1.0, 2.0], [4.0, 5.0])
+
+    feed = diff_snapshots(None, current)
+    assert feed["Change"].tolist() == ["new", "new"]
+    assert feed["Colors"].dtype == current["Colors"].dtype
+
+
+def test_diff_snapshots_missing_ratings_are_equal():
+    previous = _snapshot(["Product A"], [1.0], [np.nan])
+    current = _snapshot(["Product A"], [1.0], [np.nan])
+
+    assert diff_snapshots(previous, current).empty
+
+
+def test_diff_snapshots_large_input():
+    n = 1_000_000
+    previous = _snapshot([f"Product {i}" for i in range(n)], np.arange(n, dtype=float) + 1, [4.0] * n)
+    current = previous.copy()
+    current.loc[::1000, "Price"] *= 2
+
+    start = time.perf_counter()
+    feed = diff_snapshots(previous, current)
+    elapsed = time.perf_counter() - start
+
+    assert (feed["Change"] == "price_up").sum() == n // 1000
+    assert elapsed < 30
+
+
+def test_diff_snapshots_error_handling():
+    result = diff_snapshots(None, pd.DataFrame({"WrongCol": [1, 2]}))
+    assert result is None
+
+
+# ---------- Test snapshot files ----------
+def test_snapshot_roundtrip(tmp_path):
+    file_name = str(tmp_path / "snapshot.pkl")
+    assert load_snapshot(file_name) is None
+
+    current = _snapshot(["Product A"], [1.0], [4.0])
+    save_snapshot(current, file_name)
+    pd.testing.assert_frame_equal(load_snapshot(file_name), current)
@@ -3,7 +3,16 @@ import datetime
 from unittest.mock import patch, MagicMock
 from bs4 import BeautifulSoup
 
-from utils.extract import fetching_content, extract_fashion_data, scrape_fashion
+from utils.archive import archive_page
+
+from utils.extract import (
+    fetching_content,
+    extract_fashion_data,
+    scrape_fashion,
+    scrape_fashion_columns,
+    new_fashion_batch,
+    append_fashion_data,
+)
 
 
 # ---------- Test fetching_content ----------
@@ -149,3 +158,156 @@ def test_scrape_fashion_with_next_page(mock_fetch):
     assert len(result) == 2
     assert result[0]["Title"] == "First Product"
     assert result[1]["Title"] == "Second Product"
+
+
+# ---------- Test append_fashion_data ----------
+def test_append_fashion_data_success():
+    html = """
+    <div class="product-details">
+        <h3>Sample Product</h3>
+        <div class="price-container"><span class="price">$100</span></div>
+        <p>4.5 Stars</p>
+        <p>Red, Blue</p>
+        <p>L</p>
+        <p>Men</p>
+    </div>
+    """
+    product_details = BeautifulSoup(html, "html.parser").find("div", class_="product-details")
+    timestamp = datetime.datetime(2025, 1, 1, 10, 0, 0)
+
+    batch = new_fashion_batch()
+    assert append_fashion_data(batch, product_details, timestamp) is True
+    assert batch == {
+        "Title": ["Sample Product"],
+        "Price": ["$100"],
+        "Rating": ["4.5 Stars"],
+        "Colors": ["Red, Blue"],
+        "Size": ["L"],
+        "Gender": ["Men"],
+        "Timestamp": [timestamp],
+    }
+
+
+def test_append_fashion_data_skips_invalid_product():
+    html = """
+    <div class="product-details">
+        <h3>Broken Product</h3>
+        <p>$10</p>
+    </div>
+    """
+    product_details = BeautifulSoup(html, "html.parser").find("div", class_="product-details")
+
+    batch = new_fashion_batch()
+    assert append_fashion_data(batch, product_details, datetime.datetime.now()) is False
+    # No partial row is left behind
+    assert all(len(values) == 0 for values in batch.values())
+
+
+# ---------- Test scrape_fashion_columns ----------
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_columns_with_next_page(mock_fetch):
+    first_page_html = """
+    <html>
+    <body>
+        <div class="product-details">
+            <h3>First Product</h3>
+            <p>$10</p>
+            <p>4 Stars</p>
+            <p>Blue</p>
+            <p>M</p>
+            <p>Men</p>
+        </div>
+        <div class="product-details">
+            <h3>Broken Product</h3>
+        </div>
+        <div class="product-details">
+            <h3>Second Product</h3>
+            <p>$20</p>
+            <p>5 Stars</p>
+            <p>Red</p>
+            <p>L</p>
+            <p>Women</p>
+        </div>
+        <li class="page-item next"></li>
+    </body>
+    </html>
+    """
+    second_page_html = """
+    <html>
+    <body>
+        <div class="product-details">
+            <h3>Third Product</h3>
+            <p>$30</p>
+            <p>3 Stars</p>
+            <p>Black</p>
+            <p>S</p>
+            <p>Unisex</p>
+        </div>
+    </body>
+    </html>
+    """
+    mock_fetch.side_effect = [
+        first_page_html.encode("utf-8"),
+        second_page_html.encode("utf-8"),
+    ]
+
+    result = scrape_fashion_columns("http://example.com", start_page=2, delay=0)
+    assert result["Title"] == ["First Product", "Second Product", "Third Product"]
+    assert result["Price"] == ["$10", "$20", "$30"]
+    # Products of the same page share one capture timestamp
+    assert result["Timestamp"][0] is result["Timestamp"][1]
+    assert all(len(values) == 3 for values in result.values())
+
+
+# ---------- Test archive and replay ----------
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_columns_archive_then_replay(mock_fetch, tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    html = """
+    <html>
+    <body>
+        <div class="product-details">
+            <h3>Archived Product</h3>
+            <p>$50</p>
+            <p>5 Stars</p>
+            <p>Green</p>
+            <p>S</p>
+            <p>Unisex</p>
+        </div>
+    </body>
+    </html>
+    """
+    mock_fetch.side_effect = [html.encode("utf-8"), None]
+
+    live = scrape_fashion_columns("http://example.com/", delay=0, archive_dir=archive_dir)
+    assert live["Title"] == ["Archived Product"]
+
+    # Replay reads from the archive without touching the network
+    mock_fetch.reset_mock()
+    replayed = scrape_fashion_columns("http://example.com/", delay=0, replay_dir=archive_dir)
+    mock_fetch.assert_not_called()
+    assert replayed["Title"] == ["Archived Product"]
+    # The original fetch time is kept
+    assert replayed["Timestamp"] == live["Timestamp"]
+
+
+@patch("utils.extract.fetching_content")
+def test_scrape_fashion_replay(mock_fetch, tmp_path):
+    archive_dir = str(tmp_path / "archive")
+    html = """
+    <div class="product-details">
+        <h3>Replayed Product</h3>
+        <p>$50</p>
+        <p>5 Stars</p>
+        <p>Green</p>
+        <p>S</p>
+        <p>Unisex</p>
+    </div>
+    """
+    fetch_time = datetime.datetime(2025, 1, 1, 10, 0, 0)
+    archive_page(archive_dir, "http://example.com/", html.encode("utf-8"), fetch_time=fetch_time)
+
+    result = scrape_fashion("http://example.com/", delay=0, replay_dir=archive_dir)
+    mock_fetch.assert_not_called()
+    assert result[0]["Title"] == "Replayed Product"
+    assert result[0]["Timestamp"] == fetch_time
@@ -1,7 +1,12 @@
 import pytest
 import pandas as pd
 from unittest.mock import patch, MagicMock
-from utils.gsheets_loader import colnum_to_excel_col, load_to_google_sheets 
+from utils.gsheets_loader import (
+    colnum_to_excel_col,
+    load_to_google_sheets,
+    get_sheets_service,
+    clear_sheets_service_cache,
+)
 
 # ---------- Test colnum_to_excel_col ----------
 @pytest.mark.parametrize("input_val,expected", [
@@ -18,6 +23,8 @@ def test_colnum_to_excel_col(input_val, expected):
 
 # ---------- Test load_to_google_sheets ----------
 def test_load_to_google_sheets_success():
+    clear_sheets_service_cache()
+
     # DataFrame dummy
     df = pd.DataFrame({"A": [1, 2], "B": [3, 4]})
 
@@ -43,9 +50,66 @@ def test_load_to_google_sheets_success():
         mock_sheet.values.return_value.update.return_value.execute.assert_called_once()
 
 def test_load_to_google_sheets_exception():
+    clear_sheets_service_cache()
     df = pd.DataFrame({"A": [1]})
 
     # Credential simulation triggers an exception
     with patch("utils.gsheets_loader.Credentials.from_service_account_file", side_effect=Exception("Auth gagal")):
         load_to_google_sheets(df)
-        # The test is successful if the exception is handled (not raised).
\ No newline at end of file
+        # The test is successful if the exception is handled (not raised).
+
+# ---------- Test get_sheets_service ----------
+def test_get_sheets_service_is_cached():
+    clear_sheets_service_cache()
+
+    with patch("utils.gsheets_loader.Credentials.from_service_account_file") as mock_cred, \
+         patch("utils.gsheets_loader.build") as mock_build:
+
+        first = get_sheets_service("secret.json", ["scope"])
+        second = get_sheets_service("secret.json", ["scope"])
+
+        # Credentials are loaded and the client is built only once
+        assert first is second
+        mock_cred.assert_called_once()
+        mock_build.assert_called_once_with(
+            "sheets", "v4",
+            credentials=mock_cred.return_value,
+            static_discovery=True,
+            cache_discovery=False
+        )
+
+    clear_sheets_service_cache()
+
+
+def test_load_to_google_sheets_reuses_service():
+    clear_sheets_service_cache()
+    df = pd.DataFrame({"A": [1, 2]})
+
+    with patch("utils.gsheets_loader.Credentials.from_service_account_file") as mock_cred, \
+         patch("utils.gsheets_loader.build") as mock_build:
+
+        load_to_google_sheets(df)
+        load_to_google_sheets(df)
+
+        mock_cred.assert_called_once()
+        mock_build.assert_called_once()
+        update = mock_build.return_value.spreadsheets.return_value.values.return_value.update
+        assert update.call_count == 2
+
+    clear_sheets_service_cache()
+
+
+def test_load_to_google_sheets_clears_and_writes_target_sheet():
+    clear_sheets_service_cache()
+    df = pd.DataFrame({"A": [1, 2]})
+
+    with patch("utils.gsheets_loader.Credentials.from_service_account_file"), \
+         patch("utils.gsheets_loader.build") as mock_build:
+
+        assert load_to_google_sheets(df, sheet_name="Changes") is True
+
+        values = mock_build.return_value.spreadsheets.return_value.values.return_value
+        assert values.clear.call_args.kwargs["range"] == "Changes"
+        assert values.update.call_args.kwargs["range"] == "Changes!A1:A3"
+
+    clear_sheets_service_cache()
@@ -0,0 +1,142 @@
+import os
+import pandas as pd
+from unittest.mock import patch
+
+import main
+
+
+def _batch():
+    timestamp = pd.Timestamp("2025-01-01 10:00:00").to_pydatetime()
+    return {
+        "Title": ["Product A", "Product B"],
+        "Price": ["$10", "$20"],
+        "Rating": ["⭐ 4.5 / 5", "⭐ 3.9 / 5"],
+        "Colors": ["3 Colors", "2 Colors"],
+        "Size": ["Size: M", "Size: L"],
+        "Gender": ["Gender: Men", "Gender: Women"],
+        "Timestamp": [timestamp, timestamp],
+    }
+
+
+def _run_main(database_saved=True, sheets_saved=True, **kwargs):
+    with patch("main.scrape_fashion_columns", side_effect=lambda *a, **k: _batch()), \
+         patch("main.load_to_database", return_value=database_saved) as mock_database, \
+         patch("main.load_to_google_sheets", return_value=sheets_saved) as mock_sheets:
+        result = main.main(**kwargs)
+    return result, mock_database, mock_sheets
+
+
+# ---------- Test main ----------
+def test_main_keeps_full_csv_and_loads_new_products_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    _, mock_database, _ = _run_main()
+    assert len(mock_database.call_args.args[0]) == 2
+
+    # Unchanged catalog: nothing new for Database, but the overwritten
+    # sinks (CSV and Sheets) keep every product
+    _, mock_database, mock_sheets = _run_main()
+    assert mock_database.call_args.args[0].empty
+    assert len(mock_sheets.call_args.args[0]) == 2
+    assert len(pd.read_csv("products.csv")) == 2
+
+
+def test_main_does_not_mark_products_seen_when_database_fails(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    _run_main(database_saved=False)
+    assert not os.path.exists("product_keys.npy")
+
+    # The products are retried on the next run
+    _, mock_database, _ = _run_main()
+    assert len(mock_database.call_args.args[0]) == 2
+
+
+def test_main_sheets_failure_does_not_reload_database(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    # Database got the products, Sheets failed
+    _run_main(sheets_saved=False)
+
+    # The products are not appended to Database again
+    _, mock_database, _ = _run_main()
+    assert mock_database.call_args.args[0].empty
+
+
+def test_main_reports_loader_failure(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    assert _run_main()[0] is True
+    assert _run_main(sheets_saved=False)[0] is False
+    assert _run_main(database_saved=False, changes_only=True)[0] is False
+
+
+def test_main_reports_missing_data(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with patch("main.scrape_fashion_columns", return_value=None):
+        assert main.main() is False
+
+
+def test_main_changes_only_does_not_mark_products_seen(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    _, mock_database, _ = _run_main(changes_only=True)
+    assert mock_database.call_args.args[1] == "product_changes"
+    assert not os.path.exists("product_keys.npy")
+
+    # A later full run still loads every product
+    _, mock_database, _ = _run_main()
+    assert mock_database.call_args.args[1] == "product_records"
+    assert len(mock_database.call_args.args[0]) == 2
+    assert len(pd.read_csv("products.csv")) == 2
+
+
+# ---------- Test run_chunked ----------
+def test_run_chunked_loads_every_chunk(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    input_file = str(tmp_path / "raw.csv")
+    rows = pd.DataFrame(_batch())
+    pd.concat([rows.assign(Title=rows["Title"] + f" {i}") for i in range(5)]).to_csv(input_file, index=False)
+
+    loaded = []
+
+    def fake_load_chunks_to_database(chunks, table_name):
+        loaded.extend(chunks)
+        return True
+
+    with patch("main.load_chunks_to_database", side_effect=fake_load_chunks_to_database):
+        assert main.run_chunked(input_file, chunk_size=3, spill_dir=str(tmp_path)) is True
+
+    # Database gets the same chunks as the CSV
+    assert [len(chunk) for chunk in loaded] == [3, 3, 3, 1]
+
+    assert len(pd.read_csv("products.csv")) == 10
+    # Spilled chunks are cleaned up
+    assert sorted(os.listdir(tmp_path)) == ["products.csv", "raw.csv"]
+
+
+def test_main_changes_only_keeps_snapshot_until_feed_is_loaded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    # Sheets fails: the snapshot must not move forward
+    _, _, mock_sheets = _run_main(sheets_saved=False, changes_only=True)
+    assert mock_sheets.call_args.kwargs["sheet_name"] == "Changes"
+    assert not os.path.exists("products_snapshot.pkl")
+
+    # The same changes are emitted again on the next run
+    _, mock_database, _ = _run_main(changes_only=True)
+    assert mock_database.call_args.args[0]["Change"].tolist() == ["new", "new"]
+    assert os.path.exists("products_snapshot.pkl")
+
+    # Nothing changed since the stored snapshot
+    _, mock_database, _ = _run_main(changes_only=True)
+    assert mock_database.call_args.args[0].empty
+
+
+def test_main_does_not_save_snapshot_without_change_feed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with patch("main.diff_snapshots", return_value=None):
+        assert _run_main()[0] is False
+    assert not os.path.exists("products_snapshot.pkl")
@@ -0,0 +1,108 @@
+import os
+import pstats
+import time
+import tracemalloc
+
+from utils.profiler import enable_profiling, disable_profiling, is_profiling, profile_stage
+
+
+def _allocate():
+    return [str(i) for i in range(10000)]
+
+
+def _allocate_temporary():
+    data = [bytes(1024) for _ in range(5000)]  # ~5 MiB, freed on return
+    time.sleep(0.1)
+    return len(data)
+
+
+# ---------- Test profile_stage ----------
+def test_profile_stage_disabled_is_noop(tmp_path):
+    assert not is_profiling()
+
+    with profile_stage("transform"):
+        _allocate()
+
+    assert disable_profiling() is None
+    assert not tracemalloc.is_tracing()
+
+
+def test_profile_stage_writes_reports(tmp_path):
+    output_dir = str(tmp_path / "profiles")
+    enable_profiling(output_dir, top_n=3)
+    assert is_profiling()
+
+    with profile_stage("fetch"):
+        _allocate()
+    with profile_stage("fetch"):
+        _allocate()
+    with profile_stage("transform"):
+        _allocate()
+
+    summary_file = disable_profiling()
+    assert not is_profiling()
+    assert not tracemalloc.is_tracing()
+
+    # One pstats file per stage
+    for stage in ["fetch", "transform"]:
+        stats = pstats.Stats(os.path.join(output_dir, f"{stage}.pstats"))
+        assert any(func[2] == "_allocate" for func in stats.stats)
+
+    with open(summary_file) as f:
+        summary = f.read()
+
+    # Repeated blocks are added up into one stage
+    fetch_line = next(line for line in summary.splitlines() if line.startswith("fetch"))
+    assert fetch_line.split()[1] == "2"
+    assert "Top 3 allocation sites at the peak of transform:" in summary
+    assert "test_profiler.py" in summary
+    # The profiler's own snapshots are not reported
+    assert "tracemalloc.py" not in summary
+
+
+def test_profile_stage_records_failed_stage(tmp_path):
+    enable_profiling(str(tmp_path))
+
+    try:
+        with profile_stage("load_database"):
+            raise ValueError("Koneksi gagal")
+    except ValueError:
+        pass
+
+    summary_file = disable_profiling()
+    with open(summary_file) as f:
+        assert "load_database" in f.read()
+
+
+def test_profile_stage_peak_is_per_stage(tmp_path):
+    enable_profiling(str(tmp_path))
+    retained = [bytes(1024) for _ in range(2000)]  # ~2 MiB held before the stage
+
+    with profile_stage("small"):
+        _allocate()
+
+    summary_file = disable_profiling()
+    del retained
+
+    with open(summary_file) as f:
+        small_line = next(line for line in f if line.startswith("small"))
+
+    # Memory allocated before the stage does not count towards its peak
+    assert float(small_line.split()[-1]) < 1024
+
+
+def test_profile_stage_reports_sites_at_peak(tmp_path):
+    enable_profiling(str(tmp_path), top_n=3)
+
+    with profile_stage("load_csv"):
+        _allocate_temporary()
+
+    summary_file = disable_profiling()
+    with open(summary_file) as f:
+        summary = f.read()
+
+    # The temporary is freed before the stage ends but still drove its peak
+    sites = summary.split("Top 3 allocation sites at the peak of load_csv:")[1]
+    top_size, top_site = sites.strip().splitlines()[0].split(" KiB ")
+    assert float(top_size) > 4096
+    assert "test_profiler.py" in top_site
@@ -0,0 +1,134 @@
+import os
+import sys
+import json
+import threading
+import subprocess
+from unittest.mock import MagicMock
+
+from utils.scheduler import run_once, run_scheduler, get_status, acquire_file_lock, release_file_lock
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ---------- Test run_once ----------
+def test_run_once_success():
+    job = MagicMock(return_value=True)
+    runs_before = get_status()["runs"]
+
+    assert run_once(job) is True
+
+    status = get_status()
+    job.assert_called_once()
+    assert status["runs"] == runs_before + 1
+    assert status["last_success"] is True
+    assert status["last_error"] is None
+    assert status["last_duration"] >= 0
+    assert status["running"] is False
+
+
+def test_run_once_records_failure():
+    job = MagicMock(side_effect=Exception("Scrape gagal"))
+
+    assert run_once(job) is True
+
+    status = get_status()
+    assert status["last_success"] is False
+    assert status["last_error"] == "Scrape gagal"
+
+
+def test_run_once_job_returning_false_is_failure():
+    run_once(MagicMock(return_value=False))
+    assert get_status()["last_success"] is False
+
+
+def test_run_once_skips_overlapping_run():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_job():
+        started.set()
+        release.wait(timeout=5)
+
+    thread = threading.Thread(target=run_once, args=(slow_job,))
+    thread.start()
+    started.wait(timeout=5)
+
+    # A second run while the first is in progress is skipped
+    other_job = MagicMock()
+    assert run_once(other_job) is False
+    other_job.assert_not_called()
+    assert get_status()["running"] is True
+
+    release.set()
+    thread.join()
+
+
+# ---------- Test run_scheduler ----------
+def test_run_scheduler_runs_on_interval():
+    job = MagicMock()
+    sleep = MagicMock()
+
+    run_scheduler(job, interval=10, jitter=0, max_runs=3, sleep=sleep)
+
+    assert job.call_count == 3
+    # No sleep after the last run
+    assert sleep.call_count == 2
+    for call in sleep.call_args_list:
+        assert 9 <= call.args[0] <= 10
+
+
+def test_run_scheduler_applies_jitter():
+    sleep = MagicMock()
+
+    run_scheduler(MagicMock(), interval=10, jitter=5, max_runs=2, sleep=sleep)
+
+    assert 9 <= sleep.call_args.args[0] <= 15
+
+
+def test_run_once_writes_status_file(tmp_path):
+    status_file = str(tmp_path / "status.json")
+
+    run_once(MagicMock(return_value=False), status_file=status_file)
+
+    with open(status_file) as f:
+        status = json.load(f)
+    assert status["running"] is False
+    assert status["last_success"] is False
+    assert status["last_duration"] >= 0
+    assert status["last_finished"] is not None
+
+
+def test_run_once_skips_when_another_process_holds_lock(tmp_path):
+    lock_file = str(tmp_path / "etl.lock")
+
+    # A separate open file description behaves like another process
+    holder = acquire_file_lock(lock_file)
+    assert holder is not None
+    try:
+        job = MagicMock()
+        assert run_once(job, lock_file=lock_file) is False
+        job.assert_not_called()
+        assert get_status()["running"] is False
+    finally:
+        release_file_lock(holder)
+
+    # Once released, the run goes ahead and frees the lock again
+    job = MagicMock()
+    assert run_once(job, lock_file=lock_file) is True
+    job.assert_called_once()
+    release_file_lock(acquire_file_lock(lock_file))
+
+
+def test_file_lock_blocks_other_process(tmp_path):
+    lock_file = str(tmp_path / "etl.lock")
+    holder = acquire_file_lock(lock_file)
+
+    try:
+        code = (
+            "import sys; from utils.scheduler import acquire_file_lock; "
+            f"sys.exit(0 if acquire_file_lock({lock_file!r}) is None else 1)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR)
+        assert result.returncode == 0
+    finally:
+        release_file_lock(holder)
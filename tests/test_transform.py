@@ -1,6 +1,18 @@
+import pytest
 import pandas as pd
-from utils.transform import transform_to_DataFrame, transform_data
+import numpy as np
+from utils.transform import (
+    transform_to_DataFrame,
+    transform_data,
+    hash_products,
+    deduplicate_products,
+    append_key_index,
+    transform_chunks,
+    spill_chunks,
+    read_spilled_chunks,
+)
 import datetime
+import tracemalloc
 
 # ---------- Test transform_to_DataFrame ----------
 def test_transform_to_DataFrame_success():
@@ -69,4 +81,176 @@ def test_transform_data_error_handling():
     # DataFrame with incorrect columns
     df = pd.DataFrame({"WrongCol": [1, 2, 3]})
     result = transform_data(df, exchange_rate=16000)
-    assert result is None
\ No newline at end of file
+    assert result is None
+
+# ---------- Test deduplicate_products ----------
+def _content_frame():
+    return pd.DataFrame({
+        "Title": ["Product A", "Product A", "Product B"],
+        "Price": [160000.0, 160000.0, 320000.0],
+        "Rating": [4.5, 4.5, 3.9],
+        "Colors": [3, 3, 2],
+        "Size": ["M", "M", "L"],
+        "Gender": ["Men", "Men", "Women"],
+        "Timestamp": ["2025-01-01 10:00:00", "2025-01-01 10:00:01", "2025-01-01 10:00:02"],
+    })
+
+
+def test_hash_products_ignores_timestamp():
+    keys = hash_products(_content_frame())
+    assert keys.dtype == np.uint64
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+
+
+def test_transform_data_drops_duplicates_with_different_timestamps():
+    raw_data = [
+        {"Title": "Product A", "Price": "$10", "Rating": "⭐ 4.5 / 5",
+         "Colors": "3 Colors", "Size": "Size: M", "Gender": "Gender: Men",
+         "Timestamp": datetime.datetime(2025, 1, 1, 10, 0, 0)},
+        {"Title": "Product A", "Price": "$10", "Rating": "⭐ 4.5 / 5",
+         "Colors": "3 Colors", "Size": "Size: M", "Gender": "Gender: Men",
+         "Timestamp": datetime.datetime(2025, 1, 1, 10, 0, 1)},
+    ]
+    transformed_df = transform_data(transform_to_DataFrame(raw_data), exchange_rate=16000)
+    assert transformed_df.shape[0] == 1
+
+
+def test_deduplicate_products_in_batch():
+    result, keys = deduplicate_products(_content_frame())
+    assert result["Title"].tolist() == ["Product A", "Product B"]
+    assert len(keys) == 2
+
+
+def test_deduplicate_products_with_persistent_index(tmp_path):
+    index_file = str(tmp_path / "keys.npy")
+
+    first_run, keys = deduplicate_products(_content_frame(), index_file=index_file)
+    assert first_run.shape[0] == 2
+
+    # The index is only updated once the keys are committed
+    again, _ = deduplicate_products(_content_frame(), index_file=index_file)
+    assert again.shape[0] == 2
+    append_key_index(keys, index_file)
+
+    # Same products on the next run are all dropped
+    second_run, second_keys = deduplicate_products(_content_frame(), index_file=index_file)
+    assert second_run.empty
+    assert len(second_keys) == 0
+
+    # Only the new product passes through
+    df = _content_frame()
+    df.loc[2, "Price"] = 300000.0
+    third_run, _ = deduplicate_products(df, index_file=index_file)
+    assert third_run["Price"].tolist() == [300000.0]
+
+
+def test_deduplicate_products_error_handling():
+    result, keys = deduplicate_products(pd.DataFrame({"WrongCol": [1, 2]}))
+    assert result is None
+    assert keys is None
+
+
+def test_transform_columnar_batch():
+    timestamp = datetime.datetime.now()
+    batch = {
+        "Title": ["Product A", "Product B"],
+        "Price": ["$10", "$20"],
+        "Rating": ["⭐ 4.5 / 5", "⭐ 3.9 / 5"],
+        "Colors": ["3 Colors", "2 Colors"],
+        "Size": ["Size: M", "Size: L"],
+        "Gender": ["Gender: Men", "Gender: Women"],
+        "Timestamp": [timestamp, timestamp],
+    }
+    transformed_df = transform_data(transform_to_DataFrame(batch), exchange_rate=16000)
+    assert transformed_df["Title"].tolist() == ["Product A", "Product B"]
+    assert transformed_df["Price"].tolist() == [160000, 320000]
+
+
+# ---------- Test transform_chunks ----------
+def _raw_rows(n):
+    for i in range(n):
+        yield {"Title": f"Product {i}", "Price": f"${i % 100 + 1}", "Rating": "⭐ 4.5 / 5",
+               "Colors": "3 Colors", "Size": "Size: M", "Gender": "Gender: Men",
+               "Timestamp": "2025-01-01 10:00:00"}
+
+
+def test_transform_chunks_from_iterator():
+    chunks = list(transform_chunks(_raw_rows(25), exchange_rate=16000, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert pd.concat(chunks)["Title"].tolist() == [f"Product {i}" for i in range(25)]
+    assert chunks[0]["Price"].iloc[0] == 16000
+
+
+def test_transform_chunks_from_columnar_batch():
+    batch = pd.DataFrame(list(_raw_rows(5))).to_dict(orient="list")
+    chunks = list(transform_chunks(batch, exchange_rate=16000, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_transform_chunks_from_csv(tmp_path):
+    file_name = str(tmp_path / "raw.csv")
+    pd.DataFrame(list(_raw_rows(30))).to_csv(file_name, index=False)
+
+    chunks = list(transform_chunks(file_name, exchange_rate=16000, chunk_size=7))
+    assert sum(len(chunk) for chunk in chunks) == 30
+    assert chunks[0]["Colors"].dtype == int
+
+
+def test_transform_chunks_memory_budget():
+    source = pd.DataFrame(list(_raw_rows(5000)))
+    bytes_per_row = source.memory_usage(deep=True).sum() / len(source)
+
+    chunks = list(transform_chunks(iter(source.to_dict(orient="records")), exchange_rate=16000,
+                                   memory_budget=int(bytes_per_row * 4 * 1000)))
+    assert sum(len(chunk) for chunk in chunks) == 5000
+    assert 900 <= max(len(chunk) for chunk in chunks) <= 1100
+
+
+def test_transform_chunks_skips_invalid_chunks():
+    chunks = list(transform_chunks([{"WrongCol": 1}], exchange_rate=16000, chunk_size=10))
+    assert chunks == []
+
+
+def test_transform_chunks_constant_peak_memory():
+    def peak_memory(num_rows):
+        tracemalloc.start()
+        for _ in transform_chunks(_raw_rows(num_rows), exchange_rate=16000, chunk_size=1000):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
+
+    # Warm up one-time allocations (imports, caches) before measuring
+    peak_memory(2_000)
+    small = peak_memory(5_000)
+    large = peak_memory(25_000)
+
+    # Five times more rows must not need noticeably more memory
+    assert large < small * 1.2
+
+
+def test_spill_chunks_roundtrip(tmp_path):
+    chunks = transform_chunks(_raw_rows(25), exchange_rate=16000, chunk_size=10)
+    paths = spill_chunks(chunks, str(tmp_path / "spill"))
+    assert len(paths) == 3
+
+    # Spilled chunks can be read more than once (e.g. by several loaders)
+    for _ in range(2):
+        restored = pd.concat(read_spilled_chunks(paths))
+        assert restored["Title"].tolist() == [f"Product {i}" for i in range(25)]
+
+
+def test_transform_chunks_from_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_name = str(tmp_path / "raw.parquet")
+    pd.DataFrame(list(_raw_rows(30))).to_parquet(file_name, index=False)
+
+    chunks = list(transform_chunks(file_name, exchange_rate=16000, chunk_size=7))
+    assert [len(chunk) for chunk in chunks] == [7, 7, 7, 7, 2]
+    assert pd.concat(chunks)["Title"].tolist() == [f"Product {i}" for i in range(30)]
+    assert chunks[0]["Colors"].dtype == int
+
+    # Chunk size derived from a memory budget (the sample reader is closed)
+    chunks = list(transform_chunks(file_name, exchange_rate=16000, memory_budget=10_000_000))
+    assert sum(len(chunk) for chunk in chunks) == 30
@@ -0,0 +1,184 @@
+import os
+import zlib
+import hashlib
+import datetime
+import numpy as np
+
+PACK_FILE = "pages.pack"
+INDEX_FILE = "pages.idx"
+
+# One fixed-width index record per archived page
+INDEX_DTYPE = np.dtype([
+    ("offset", "<u8"),
+    ("length", "<u4"),
+    ("fetch_time", "<f8"),
+    ("url_hash", "<u8"),
+])
+
+
+def url_hash(url):
+    """
+    Hash a URL into a 64-bit integer used for index lookups.
+
+    Args:
+        url (str): The page URL.
+
+    Returns:
+        int: Unsigned 64-bit hash of the URL.
+    """
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def archive_page(archive_dir, url, content, fetch_time=None):
+    """
+    Append a fetched page to the archive.
+
+    The URL and content are compressed together and appended to the pack
+    file, then a fixed-width record (offset, length, fetch time, URL hash)
+    is appended to the index. The pack is written first, so the index
+    never points to missing data, and a torn last index record left by a
+    crash is truncated before the new one is written.
+
+    Args:
+        archive_dir (str): Directory holding the pack and index files.
+        url (str): The page URL.
+        content (bytes): The raw HTML content.
+        fetch_time (datetime.datetime | None, optional): When the page was
+            fetched. Defaults to now.
+
+    Returns:
+        None
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    fetch_time = fetch_time or datetime.datetime.now()
+    blob = zlib.compress(url.encode("utf-8") + b"\0" + content)
+
+    with open(os.path.join(archive_dir, PACK_FILE), "ab") as pack:
+        offset = pack.tell()
+        pack.write(blob)
+
+    record = np.array(
+        [(offset, len(blob), fetch_time.timestamp(), url_hash(url))], dtype=INDEX_DTYPE
+    )
+    with open(os.path.join(archive_dir, INDEX_FILE), "ab") as index:
+        # Drop a torn last record (e.g. after a crash) so new records stay aligned
+        size = index.seek(0, os.SEEK_END)
+        if size % INDEX_DTYPE.itemsize:
+            index.truncate(size - size % INDEX_DTYPE.itemsize)
+        index.write(record.tobytes())
+
+
+def load_index(archive_dir):
+    """
+    Memory-map the archive index.
+
+    Args:
+        archive_dir (str): Directory holding the pack and index files.
+
+    Returns:
+        np.ndarray: Complete index records with INDEX_DTYPE (empty if the
+        archive does not exist yet).
+    """
+    index_path = os.path.join(archive_dir, INDEX_FILE)
+    if not os.path.exists(index_path):
+        return np.empty(0, dtype=INDEX_DTYPE)
+
+    # Only map whole records, so a torn last record (e.g. after a crash) is ignored
+    num_records = os.path.getsize(index_path) // INDEX_DTYPE.itemsize
+    if num_records == 0:
+        return np.empty(0, dtype=INDEX_DTYPE)
+
+    return np.memmap(index_path, dtype=INDEX_DTYPE, mode="r", shape=(num_records,))
+
+
+def _read_record(pack, record):
+    """
+    Read and decompress one archived page.
+
+    Args:
+        pack (file): The pack file opened in binary mode.
+        record (np.void): Index record of the page.
+
+    Returns:
+        tuple[str, bytes]: The page URL and its raw content.
+    """
+    pack.seek(int(record["offset"]))
+    url, _, content = zlib.decompress(pack.read(int(record["length"]))).partition(b"\0")
+    return url.decode("utf-8"), content
+
+
+def find_page(archive_dir, url, fetch_time=None):
+    """
+    Find the archived copy of a page together with its fetch time.
+
+    Args:
+        archive_dir (str): Directory holding the pack and index files.
+        url (str): The page URL.
+        fetch_time (datetime.datetime | None, optional): Return the latest
+            copy fetched at or before this time. Defaults to None (latest).
+
+    Returns:
+        tuple[datetime.datetime, bytes] | None: The fetch time and raw HTML
+        content, or None if the page is not archived.
+    """
+    index = load_index(archive_dir)
+    mask = index["url_hash"] == np.uint64(url_hash(url))
+    if fetch_time is not None:
+        mask &= index["fetch_time"] <= fetch_time.timestamp()
+
+    positions = np.flatnonzero(mask)
+    if positions.size == 0:
+        return None
+
+    # Latest copy first, skipping (unlikely) hash collisions
+    positions = positions[np.argsort(index["fetch_time"][positions], kind="stable")[::-1]]
+    with open(os.path.join(archive_dir, PACK_FILE), "rb") as pack:
+        for position in positions:
+            archived_url, content = _read_record(pack, index[position])
+            if archived_url == url:
+                return datetime.datetime.fromtimestamp(index[position]["fetch_time"]), content
+
+    return None
+
+
+def read_page(archive_dir, url, fetch_time=None):
+    """
+    Read the archived copy of a page.
+
+    Args:
+        archive_dir (str): Directory holding the pack and index files.
+        url (str): The page URL.
+        fetch_time (datetime.datetime | None, optional): Return the latest
+            copy fetched at or before this time. Defaults to None (latest).
+
+    Returns:
+        bytes | None: The raw HTML content, or None if the page is not archived.
+    """
+    page = find_page(archive_dir, url, fetch_time)
+    return page[1] if page else None
+
+
+def iter_archive(archive_dir, start=0, stop=None):
+    """
+    Iterate over archived pages in the order they were fetched.
+
+    `start` and `stop` select a slice of index records, so several
+    workers can reprocess disjoint parts of the archive in parallel.
+
+    Args:
+        archive_dir (str): Directory holding the pack and index files.
+        start (int, optional): First index record. Defaults to 0.
+        stop (int | None, optional): Index record to stop at. Defaults to
+            None (end of the archive).
+
+    Yields:
+        tuple[str, datetime.datetime, bytes]: URL, fetch time and raw content.
+    """
+    index = load_index(archive_dir)[start:stop]
+    if index.size == 0:
+        return
+
+    with open(os.path.join(archive_dir, PACK_FILE), "rb") as pack:
+        for record in index:
+            url, content = _read_record(pack, record)
+            yield url, datetime.datetime.fromtimestamp(record["fetch_time"]), content
@@ -7,12 +7,40 @@ def load_to_csv(data, file_name):
         file_name (str): The name of the CSV file to save.
 
     Returns:
-        None
+        bool: True if the data was saved, otherwise False.
     """
     try:
         print("Saving DataFrame in .csv format")
         data.to_csv(file_name, index=False)
         print("Data successfully saved!")
+        return True
 
     except Exception as e:
         print(f"An error occurred while saving the DataFrame: {e}")
+        return False
+
+
+def load_chunks_to_csv(chunks, file_name):
+    """
+    Save DataFrame chunks to a single CSV file, one chunk at a time.
+
+    The first chunk replaces the file and writes the header; the
+    following chunks are appended without it.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The DataFrame chunks to be saved.
+        file_name (str): The name of the CSV file to save.
+
+    Returns:
+        bool: True if the data was saved, otherwise False.
+    """
+    try:
+        print("Saving DataFrame chunks in .csv format")
+        for number, chunk in enumerate(chunks):
+            chunk.to_csv(file_name, mode="w" if number == 0 else "a", header=number == 0, index=False)
+        print("Data successfully saved!")
+        return True
+
+    except Exception as e:
+        print(f"An error occurred while saving the DataFrame: {e}")
+        return False
@@ -1,11 +1,48 @@
 from sqlalchemy import create_engine
 
+# Cache of SQLAlchemy engines (and their connection pools), keyed by URL
+_ENGINE_CACHE = {}
+
+
+def get_engine(database_url):
+    """
+    Return a SQLAlchemy engine for the URL, reusing it within the process.
+
+    Args:
+        database_url (str): The database connection URL.
+
+    Returns:
+        sqlalchemy.engine.Engine: The cached engine.
+    """
+    engine = _ENGINE_CACHE.get(database_url)
+    if engine is None:
+        engine = create_engine(database_url)
+        _ENGINE_CACHE[database_url] = engine
+
+    return engine
+
+
+def clear_engine_cache():
+    """
+    Dispose and drop all cached engines.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    for engine in _ENGINE_CACHE.values():
+        engine.dispose()
+    _ENGINE_CACHE.clear()
+
+
 def load_to_database(data, table_name):
     """
     Save a DataFrame into a PostgreSQL database table.
 
-    This function connects to a PostgreSQL database using SQLAlchemy,
-    then writes the given DataFrame into the specified table.
+    This function connects to a PostgreSQL database using a cached
+    SQLAlchemy engine, then writes the given DataFrame into the specified table.
     If the table already exists, it will be replaced.
 
     Args:
@@ -13,7 +50,7 @@ def load_to_database(data, table_name):
         table_name (str): The name of the database table.
 
     Returns:
-        None
+        bool: True if the data was saved, otherwise False.
 
     Raises:
         Exception: If the connection or data saving fails.
@@ -21,7 +58,7 @@ def load_to_database(data, table_name):
     try:
         # Define database connection URL
         DATABASE_URL = "database_url"
-        engine = create_engine(DATABASE_URL)
+        engine = get_engine(DATABASE_URL)
 
         # Establish connection to the database
         with engine.connect() as connection:
@@ -31,6 +68,40 @@ def load_to_database(data, table_name):
             print("Saving DataFrames to a database")
             data.to_sql(table_name, con=connection, if_exists="append", index=False)
             print("DataFrame successfully added!")
+            return True
+
+    except Exception as e:
+        print(f"An error occurred while saving to the database: {e}")
+        return False
+
+
+def load_chunks_to_database(chunks, table_name):
+    """
+    Save DataFrame chunks into a PostgreSQL database table, one chunk at a time.
+
+    All chunks are written over the same connection and appended to the
+    table.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): The DataFrame chunks to be stored.
+        table_name (str): The name of the database table.
+
+    Returns:
+        bool: True if the data was saved, otherwise False.
+    """
+    try:
+        DATABASE_URL = "database_url"
+        engine = get_engine(DATABASE_URL)
+
+        with engine.connect() as connection:
+            print("Connected to the database!")
+
+            print("Saving DataFrame chunks to a database")
+            for chunk in chunks:
+                chunk.to_sql(table_name, con=connection, if_exists="append", index=False)
+            print("DataFrame successfully added!")
+            return True
 
     except Exception as e:
         print(f"An error occurred while saving to the database: {e}")
+        return False
@@ -0,0 +1,132 @@
+import os
+import numpy as np
+import pandas as pd
+
+from utils.transform import hash_products
+
+# Columns that identify the same product across runs
+PRODUCT_KEY = ["Title", "Colors", "Size", "Gender"]
+
+# Columns of the change feed, in output order
+CHANGE_COLUMNS = PRODUCT_KEY + [
+    "Change", "Old Price", "New Price", "Price Change Pct", "Old Rating", "New Rating"
+]
+
+
+def load_snapshot(file_name):
+    """
+    Load the snapshot saved by the previous run.
+
+    Args:
+        file_name (str): Path to the pickled snapshot.
+
+    Returns:
+        pd.DataFrame | None: The previous snapshot, or None if there is none.
+    """
+    if not os.path.exists(file_name):
+        return None
+
+    return pd.read_pickle(file_name)
+
+
+def save_snapshot(data, file_name):
+    """
+    Save the transformed DataFrame as the snapshot for the next run.
+
+    Args:
+        data (pd.DataFrame): The transformed product data.
+        file_name (str): Path to the pickled snapshot.
+
+    Returns:
+        None
+    """
+    try:
+        data.to_pickle(file_name)
+
+    except Exception as e:
+        print(f"[ERROR] Failed to save snapshot: {e}")
+
+
+def _index_by_key(data, key_columns):
+    """
+    Index a snapshot by the hash of its key columns, keeping the last
+    row for each key.
+
+    Args:
+        data (pd.DataFrame): Product snapshot.
+        key_columns (list[str]): Columns that identify a product.
+
+    Returns:
+        pd.DataFrame: Key, Price and Rating columns indexed by the key hash.
+    """
+    indexed = data[key_columns + ["Price", "Rating"]].set_index(
+        pd.Index(hash_products(data, key_columns), name="Key")
+    )
+    return indexed[~indexed.index.duplicated(keep="last")]
+
+
+def diff_snapshots(previous, current, key_columns=PRODUCT_KEY):
+    """
+    Compare two product snapshots and build a change feed.
+
+    Both snapshots are indexed by a hash of the key columns and joined
+    on that index. Every product that changed gets one row with one of
+    these `Change` values:
+        - "new": only in the current snapshot.
+        - "removed": only in the previous snapshot.
+        - "price_up" / "price_down": the price changed.
+        - "rating_change": the price is the same but the rating changed.
+    Products that did not change are left out.
+
+    Args:
+        previous (pd.DataFrame | None): Snapshot from the previous run, or
+            None if there is none (every product is then "new").
+        current (pd.DataFrame): Transformed DataFrame from this run.
+        key_columns (list[str], optional): Columns that identify a product.
+            Defaults to PRODUCT_KEY.
+
+    Returns:
+        pd.DataFrame | None: The change feed with CHANGE_COLUMNS, or None
+        if an error occurs.
+    """
+    try:
+        if previous is None:
+            previous = current.iloc[0:0]
+
+        prev = _index_by_key(previous, key_columns)
+        curr = _index_by_key(current, key_columns)
+
+        # Key columns for every product seen in either snapshot
+        keys = pd.concat([curr[key_columns], prev[key_columns]])
+        keys = keys[~keys.index.duplicated()]
+
+        old = prev[["Price", "Rating"]].rename(columns={"Price": "Old Price", "Rating": "Old Rating"})
+        new = curr[["Price", "Rating"]].rename(columns={"Price": "New Price", "Rating": "New Rating"})
+        feed = keys.join(old).join(new)
+
+        old_price = feed["Old Price"].to_numpy(dtype=float)
+        new_price = feed["New Price"].to_numpy(dtype=float)
+        old_rating = feed["Old Rating"].to_numpy(dtype=float)
+        new_rating = feed["New Rating"].to_numpy(dtype=float)
+
+        is_new = ~feed.index.isin(prev.index)
+        is_removed = ~feed.index.isin(curr.index)
+        in_both = ~is_new & ~is_removed
+        price_delta = new_price - old_price
+        rating_changed = ~((old_rating == new_rating) | (np.isnan(old_rating) & np.isnan(new_rating)))
+
+        feed["Change"] = np.select(
+            [is_new, is_removed, in_both & (price_delta > 0), in_both & (price_delta < 0), in_both & rating_changed],
+            ["new", "removed", "price_up", "price_down", "rating_change"],
+            default=""
+        )
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            feed["Price Change Pct"] = np.where(in_both, price_delta / old_price * 100, np.nan)
+
+        feed = feed[feed["Change"] != ""]
+        return feed[CHANGE_COLUMNS].reset_index(drop=True)
+
+    except Exception as e:
+        print(f"[ERROR] Failed to diff snapshots: {e}")
+        return None
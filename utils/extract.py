@@ -3,6 +3,9 @@ import requests
 import time
 import datetime
 
+from utils.archive import archive_page, find_page
+from utils.profiler import profile_stage
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
@@ -10,13 +13,38 @@ HEADERS = {
     )
 }
 
+# HTTP session shared by all requests so connections are pooled and reused
+_SESSION = None
+
+# Fields parsed from a product card, in the order parse_fashion_fields returns them
+CONTENT_FIELDS = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+FIELD_NAMES = CONTENT_FIELDS + ["Timestamp"]
+
+def get_session():
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Args:
+        None
+
+    Returns:
+        requests.Session: The session used for all page requests.
+    """
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+
+    return _SESSION
+
+
 def fetching_content(url):
     """
     Fetch the HTML content of a given URL.
 
     This function sends a GET request with a predefined user-agent header
-    to avoid being blocked by the website. If the request is successful, 
-    the raw content is returned.
+    to avoid being blocked by the website, reusing the shared session's
+    connection pool. If the request is successful, the raw content is
+    returned.
 
     Args:
         url (str): The target URL to fetch.
@@ -25,7 +53,7 @@ def fetching_content(url):
         bytes | None: The raw HTML content of the page if successful,
         otherwise None.
     """
-    session = requests.Session()
+    session = get_session()
     response = session.get(url, headers=HEADERS)
     try:
         response.raise_for_status()
@@ -36,6 +64,76 @@ def fetching_content(url):
         return None
     
 
+def fetch_page(url, archive_dir=None, replay_dir=None, replay_at=None):
+    """
+    Fetch a page from the network or, in replay mode, from the archive.
+
+    Args:
+        url (str): The target URL to fetch.
+        archive_dir (str | None, optional): If given, every page fetched
+            from the network is appended to this archive. Defaults to None.
+        replay_dir (str | None, optional): If given, the page is read from
+            this archive instead of the network. Defaults to None.
+        replay_at (datetime.datetime | None, optional): In replay mode, use
+            the latest copy fetched at or before this time. Defaults to
+            None (latest copy).
+
+    Returns:
+        tuple[bytes | None, datetime.datetime]: The raw HTML content of the
+        page (None if unavailable) and when it was fetched.
+    """
+    if replay_dir:
+        page = find_page(replay_dir, url, fetch_time=replay_at)
+        return (page[1], page[0]) if page else (None, replay_at)
+
+    fetch_time = datetime.datetime.now()
+    content = fetching_content(url)
+    if content and archive_dir:
+        try:
+            archive_page(archive_dir, url, content, fetch_time)
+
+        except Exception as e:
+            print(f"An error occurred while archiving {url}: {e}")
+
+    return content, fetch_time
+
+
+def parse_fashion_fields(product_details):
+    """
+    Parse the raw product fields from a BeautifulSoup HTML element.
+
+    Args:
+        product_details (bs4.element.Tag): A BeautifulSoup element 
+            containing product details.
+
+    Returns:
+        tuple[str, str, str, str, str, str]: Title, price, rating, colors,
+        size and gender as raw strings.
+
+    Raises:
+        Exception: If the element does not have the expected structure.
+    """
+    title = product_details.find("h3").get_text(strip=True)
+    price_container = product_details.find("div", class_="price-container")
+    p_tags = product_details.find_all("p")
+
+    if price_container:
+        price = price_container.find("span", class_="price").get_text(strip=True)
+        rating = p_tags[0].get_text(strip=True)
+        colors = p_tags[1].get_text(strip=True)
+        size = p_tags[2].get_text(strip=True)
+        gender = p_tags[3].get_text(strip=True)
+    
+    else:
+        price = p_tags[0].get_text(strip=True)
+        rating = p_tags[1].get_text(strip=True)
+        colors = p_tags[2].get_text(strip=True)
+        size = p_tags[3].get_text(strip=True)
+        gender = p_tags[4].get_text(strip=True)
+
+    return title, price, rating, colors, size, gender
+
+
 def extract_fashion_data(product_details):
     """
     Extract fashion product data from a BeautifulSoup HTML element.
@@ -53,24 +151,7 @@ def extract_fashion_data(product_details):
         None if extraction fails.
     """
     try:
-        title = product_details.find("h3").get_text(strip=True)
-        price_container = product_details.find("div", class_="price-container")
-        p_tags = product_details.find_all("p")
-
-        if price_container:
-            price = price_container.find("span", class_="price").get_text(strip=True)
-            rating = p_tags[0].get_text(strip=True)
-            colors = p_tags[1].get_text(strip=True)
-            size = p_tags[2].get_text(strip=True)
-            gender = p_tags[3].get_text(strip=True)
-        
-        else:
-            price = p_tags[0].get_text(strip=True)
-            rating = p_tags[1].get_text(strip=True)
-            colors = p_tags[2].get_text(strip=True)
-            size = p_tags[3].get_text(strip=True)
-            gender = p_tags[4].get_text(strip=True)
-        
+        title, price, rating, colors, size, gender = parse_fashion_fields(product_details)
         timestamp = datetime.datetime.now()
 
         fashion = {
@@ -90,7 +171,118 @@ def extract_fashion_data(product_details):
         return None
 
 
-def scrape_fashion(base_url, start_page=2, delay=2):
+def new_fashion_batch():
+    """
+    Create an empty column-oriented batch for scraped products.
+
+    Args:
+        None
+
+    Returns:
+        dict[str, list]: One empty list per field in FIELD_NAMES.
+    """
+    return {name: [] for name in FIELD_NAMES}
+
+
+def append_fashion_data(batch, product_details, timestamp):
+    """
+    Parse a product element and append its fields to a columnar batch.
+
+    All fields are parsed before anything is appended, so a product that
+    fails to parse is skipped and the columns stay aligned.
+
+    Args:
+        batch (dict[str, list]): Batch created by `new_fashion_batch`.
+        product_details (bs4.element.Tag): A BeautifulSoup element 
+            containing product details.
+        timestamp (datetime.datetime): Capture time shared by the page.
+
+    Returns:
+        bool: True if the product was appended, otherwise False.
+    """
+    try:
+        fields = parse_fashion_fields(product_details)
+    
+    except Exception as e:
+        print(f"An error occurred while extracting data: {e}")
+        return False
+
+    for name, value in zip(CONTENT_FIELDS, fields):
+        batch[name].append(value)
+    batch["Timestamp"].append(timestamp)
+
+    return True
+
+
+def iter_pages(base_url, start_page=2, delay=2, archive_dir=None, replay_dir=None, replay_at=None):
+    """
+    Fetch the listing pages of the given website one by one.
+
+    The base URL is fetched first, then `page{n}` starting from
+    `start_page` until a page has no next button or cannot be fetched.
+    In replay mode pages come from the archive and no delay is applied.
+
+    Args:
+        base_url (str): The base URL of the website to scrape.
+        start_page (int, optional): The page number to start scraping 
+            from. Defaults to 2.
+        delay (int, optional): Delay in seconds between page requests.
+            Defaults to 2.
+        archive_dir (str | None, optional): Archive every fetched page
+            here. Defaults to None.
+        replay_dir (str | None, optional): Read pages from this archive
+            instead of the network. Defaults to None.
+        replay_at (datetime.datetime | None, optional): Replay the copies
+            fetched at or before this time. Defaults to None (latest).
+
+    Yields:
+        tuple[BeautifulSoup, datetime.datetime]: The parsed HTML of each
+        page and when it was fetched.
+    """
+    if replay_dir:
+        delay = 0
+
+    url = base_url
+    print(f"Scraping pages: {url}")
+    
+    with profile_stage("fetch"):
+        content, fetch_time = fetch_page(url, archive_dir, replay_dir, replay_at)
+    if content:
+        with profile_stage("parse"):
+            soup = BeautifulSoup(content, "html.parser")
+        yield soup, fetch_time
+    
+    time.sleep(delay)
+
+    page_number = start_page
+    next_page_url = base_url + "page{}"
+    
+    while True:
+        url = next_page_url.format(page_number)
+        print(f"Scraping pages: {url}")
+
+        with profile_stage("fetch"):
+            content, fetch_time = fetch_page(url, archive_dir, replay_dir, replay_at)
+        if content:
+            with profile_stage("parse"):
+                soup = BeautifulSoup(content, "html.parser")
+            yield soup, fetch_time
+            
+            next_button = soup.find("li", class_="page-item next")
+            if next_button:
+                page_number += 1
+                time.sleep(delay)
+            
+            else:
+                print("Couldn't find the next button")
+                break
+        
+        else:
+            print("Content not found")
+            break
+
+
+def scrape_fashion(base_url, start_page=2, delay=2, archive_dir=None, replay_dir=None, replay_at=None):
     """
     Scrape fashion product data from multiple pages of the given website.
 
@@ -104,6 +296,12 @@ def scrape_fashion(base_url, start_page=2, delay=2):
             from. Defaults to 2.
         delay (int, optional): Delay in seconds between page requests.
             Defaults to 2.
+        archive_dir (str | None, optional): Archive every fetched page
+            here. Defaults to None.
+        replay_dir (str | None, optional): Read pages from this archive
+            instead of the network. Defaults to None.
+        replay_at (datetime.datetime | None, optional): Replay the copies
+            fetched at or before this time. Defaults to None (latest).
 
     Returns:
         list[dict] | None: A list of extracted fashion product data if 
@@ -111,46 +309,16 @@ def scrape_fashion(base_url, start_page=2, delay=2):
     """
     data = []
     try:
-        url = base_url
-        print(f"Scraping pages: {url}")
-        
-        content = fetching_content(url)
-        if content:
-            soup = BeautifulSoup(content, "html.parser")
-            product_details = soup.find_all("div", class_="product-details")
-            for product in product_details:
-                fashion = extract_fashion_data(product)
-                data.append(fashion)
-        
-        time.sleep(delay)
-
-        page_number = start_page
-        next_page_url = base_url + "page{}"
-        
-        while True:
-            url = next_page_url.format(page_number)
-            print(f"Scraping pages: {url}")
-
-            content = fetching_content(url)
-            if content:
-                soup = BeautifulSoup(content, "html.parser")
+        for soup, fetch_time in iter_pages(base_url, start_page, delay, archive_dir, replay_dir, replay_at):
+            with profile_stage("parse"):
                 product_details = soup.find_all("div", class_="product-details")
                 for product in product_details:
                     fashion = extract_fashion_data(product)
+
+                    # Replayed products keep the time the page was originally fetched
+                    if fashion and replay_dir:
+                        fashion["Timestamp"] = fetch_time
                     data.append(fashion)
-                
-                next_button = soup.find("li", class_="page-item next")
-                if next_button:
-                    page_number += 1
-                    time.sleep(delay)
-                
-                else:
-                    print("Couldn't find the next button")
-                    break
-            
-            else:
-                print("Content not found")
-                break
 
         return data
     
@@ -158,3 +326,42 @@ def scrape_fashion(base_url, start_page=2, delay=2):
         print(f"Error saat menggambil seluruh data: {e}")
         return None
 
+
+def scrape_fashion_columns(base_url, start_page=2, delay=2, archive_dir=None, replay_dir=None, replay_at=None):
+    """
+    Scrape fashion product data into per-column lists.
+
+    Works like `scrape_fashion`, but appends parsed fields directly into
+    one list per column instead of building a dict per product. Products
+    that fail to parse are skipped, and all products of a page share the
+    time the page was fetched.
+
+    Args:
+        base_url (str): The base URL of the website to scrape.
+        start_page (int, optional): The page number to start scraping 
+            from. Defaults to 2.
+        delay (int, optional): Delay in seconds between page requests.
+            Defaults to 2.
+        archive_dir (str | None, optional): Archive every fetched page
+            here. Defaults to None.
+        replay_dir (str | None, optional): Read pages from this archive
+            instead of the network. Defaults to None.
+        replay_at (datetime.datetime | None, optional): Replay the copies
+            fetched at or before this time. Defaults to None (latest).
+
+    Returns:
+        dict[str, list] | None: Column name to list of values if 
+        successful, otherwise None.
+    """
+    batch = new_fashion_batch()
+    try:
+        for soup, fetch_time in iter_pages(base_url, start_page, delay, archive_dir, replay_dir, replay_at):
+            with profile_stage("parse"):
+                for product in soup.find_all("div", class_="product-details"):
+                    append_fashion_data(batch, product, fetch_time)
+
+        return batch
+    
+    except Exception as e:
+        print(f"Error saat menggambil seluruh data: {e}")
+        return None
@@ -1,6 +1,9 @@
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
+# Cache of built Sheets service objects, keyed by (service account file, scopes)
+_SHEETS_SERVICE_CACHE = {}
+
 def colnum_to_excel_col(n):
     """
     Convert a column number to an Excel-style column letter.
@@ -38,21 +41,70 @@ def colnum_to_excel_col(n):
         return None
 
 
-def load_to_google_sheets(data):
+def get_sheets_service(service_account_file, scopes):
+    """
+    Return a Google Sheets API service object, reusing it within the process.
+
+    The first call for a given service account file and scope set loads the
+    credentials and builds the client from the discovery document bundled
+    with `google-api-python-client` (no network fetch). Later calls return
+    the same service object, so its credentials and refreshed access token
+    are reused instead of being minted again.
+
+    Args:
+        service_account_file (str): Path to the service account JSON file.
+        scopes (list[str]): OAuth scopes requested for the credentials.
+
+    Returns:
+        googleapiclient.discovery.Resource: The Sheets API service object.
+    """
+    key = (service_account_file, tuple(scopes))
+    service = _SHEETS_SERVICE_CACHE.get(key)
+
+    if service is None:
+        credential = Credentials.from_service_account_file(service_account_file, scopes=scopes)
+        service = build(
+            'sheets', 'v4',
+            credentials=credential,
+            static_discovery=True,
+            cache_discovery=False
+        )
+        _SHEETS_SERVICE_CACHE[key] = service
+
+    return service
+
+
+def clear_sheets_service_cache():
+    """
+    Drop all cached Sheets service objects.
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    _SHEETS_SERVICE_CACHE.clear()
+
+
+def load_to_google_sheets(data, sheet_name="Sheet1"):
     """
     Upload a pandas DataFrame to a Google Spreadsheet.
 
     This function:
-        1. Authenticates using a Google service account.
+        1. Gets a (cached) Sheets client authenticated with a service account.
         2. Converts the DataFrame into a list format suitable for Google Sheets.
         3. Calculates the range of cells required to fit the DataFrame.
-        4. Updates the Google Sheet with the DataFrame content.
+        4. Clears the target sheet, so no stale rows are left below the data.
+        5. Updates the Google Sheet with the DataFrame content.
 
     Args:
         data (pd.DataFrame): The DataFrame to upload.
+        sheet_name (str, optional): The sheet (tab) to write to. It must
+            already exist in the spreadsheet. Defaults to "Sheet1".
 
     Returns:
-        None
+        bool: True if the data was uploaded, otherwise False.
 
     Raises:
         Exception: If authentication fails or the upload process encounters an error.
@@ -61,9 +113,6 @@ def load_to_google_sheets(data):
     SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
     try:
-        # Authenticate with Google Sheets API
-        credential = Credentials.from_service_account_file(SERVICE_ACCOUNT_FILE, scopes=SCOPES)
-
         # Target Google Spreadsheet ID (should be stored in env/secure config ideally)
         SPREADSHEET_ID = "spreadsheet_id"
 
@@ -75,16 +124,19 @@ def load_to_google_sheets(data):
         end_col = colnum_to_excel_col(num_cols)
         end_row = num_rows + 1  # +1 for header
         end_cell = f"{end_col}{end_row}"
-        RANGE_NAME = f"Sheet1!{start_cell}:{end_cell}"
+        RANGE_NAME = f"{sheet_name}!{start_cell}:{end_cell}"
 
-        # Prepare Google Sheets API client
-        service = build('sheets', 'v4', credentials=credential)
+        # Prepare Google Sheets API client (reused across calls)
+        service = get_sheets_service(SERVICE_ACCOUNT_FILE, SCOPES)
         sheet = service.spreadsheets()
 
         # Prepare body (header + data rows)
         values = [data.columns.tolist()] + data.values.tolist()
         body = {"values": values}
 
+        # Clear the previous upload of this sheet
+        sheet.values().clear(spreadsheetId=SPREADSHEET_ID, range=sheet_name, body={}).execute()
+
         # Update sheet values
         sheet.values().update(
             spreadsheetId=SPREADSHEET_ID,
@@ -94,6 +146,8 @@ def load_to_google_sheets(data):
         ).execute()
 
         print("Successfully added data to Google Spreadsheets!")
+        return True
 
     except Exception as e:
         print(f"Failed to add data: {e}")
+        return False
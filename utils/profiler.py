@@ -0,0 +1,228 @@
+import os
+import time
+import threading
+import cProfile
+import tracemalloc
+import contextlib
+from collections import Counter
+
+# Active profiling session, or None when profiling is disabled
+_SESSION = None
+
+# Peak sampling: check every SAMPLE_INTERVAL seconds, and take a new snapshot
+# once traced memory grew by SAMPLE_GROWTH (and at least SAMPLE_MIN_GROWTH bytes)
+SAMPLE_INTERVAL = 0.01
+SAMPLE_GROWTH = 0.1
+SAMPLE_MIN_GROWTH = 64 * 1024
+
+# Leave the profiler's own snapshots and sampling thread out of the allocation reports
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, threading.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def enable_profiling(output_dir, top_n=10):
+    """
+    Start a profiling session for the pipeline stages.
+
+    While the session is active, every `profile_stage` block is run under
+    cProfile and tracemalloc.
+
+    Args:
+        output_dir (str): Directory for the pstats files and the summary.
+        top_n (int, optional): Number of allocation sites reported per
+            stage. Defaults to 10.
+
+    Returns:
+        None
+    """
+    global _SESSION
+    os.makedirs(output_dir, exist_ok=True)
+
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+
+    _SESSION = {
+        "output_dir": output_dir,
+        "top_n": top_n,
+        "started_tracemalloc": started_tracemalloc,
+        "stages": {},
+    }
+
+
+def is_profiling():
+    """
+    Tell whether a profiling session is active.
+
+    Args:
+        None
+
+    Returns:
+        bool: True if profiling is enabled.
+    """
+    return _SESSION is not None
+
+
+def _sample_peak(state, stop):
+    """
+    Keep a snapshot of the traced memory close to the stage's peak.
+
+    Runs in a background thread while a stage is profiled. Every
+    SAMPLE_INTERVAL seconds it checks the traced memory, and when it grew
+    noticeably since the last snapshot, it takes a new one. The memory
+    held by the stored snapshot itself is tracked in `state["overhead"]`
+    and left out of the peak.
+
+    Args:
+        state (dict): Shared state with "size", "peak", "overhead" and
+            "snapshot" keys.
+        stop (threading.Event): Set by the stage when it finishes.
+
+    Returns:
+        None
+    """
+    while not stop.wait(SAMPLE_INTERVAL):
+        current, peak = tracemalloc.get_traced_memory()
+        state["peak"] = max(state["peak"], peak - state["overhead"])
+
+        current -= state["overhead"]
+        if current < state["size"] + max(state["size"] * SAMPLE_GROWTH, SAMPLE_MIN_GROWTH):
+            continue
+
+        # Free the previous snapshot before measuring the new one
+        state["snapshot"] = None
+        state["overhead"] = 0
+        before_snapshot = tracemalloc.get_traced_memory()[0]
+        state["snapshot"] = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        state["overhead"] = max(0, tracemalloc.get_traced_memory()[0] - before_snapshot)
+        state["size"] = current
+
+        # Spikes while taking the snapshot are not part of the stage
+        tracemalloc.reset_peak()
+
+
+@contextlib.contextmanager
+def profile_stage(name):
+    """
+    Profile a pipeline stage if a profiling session is active.
+
+    Repeated blocks with the same name (e.g. one "fetch" per page) are
+    added up into one stage. Stages must not be nested. When profiling is
+    disabled this does nothing.
+
+    Allocation sites are taken from a snapshot close to the stage's peak
+    (sampled in a background thread), so short-lived buffers such as
+    serialisation in `to_csv` or `to_sql` show up even though they are
+    freed before the stage ends. For repeated blocks the sites of the
+    call with the highest peak are kept.
+
+    Args:
+        name (str): The stage name (e.g. "fetch", "parse", "transform").
+
+    Yields:
+        None
+    """
+    if _SESSION is None:
+        yield
+        return
+
+    stage = _SESSION["stages"].setdefault(name, {
+        "profiler": cProfile.Profile(),
+        "calls": 0,
+        "wall": 0.0,
+        "cpu": 0.0,
+        "peak": 0,
+        "allocations": Counter(),
+    })
+
+    before = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+    tracemalloc.reset_peak()
+    traced_at_start = tracemalloc.get_traced_memory()[0]
+
+    state = {"size": traced_at_start, "peak": 0, "overhead": 0, "snapshot": None}
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample_peak, args=(state, stop), daemon=True)
+    sampler.start()
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    stage["profiler"].enable()
+
+    try:
+        yield
+
+    finally:
+        stage["profiler"].disable()
+        stage["wall"] += time.perf_counter() - wall_start
+        stage["cpu"] += time.process_time() - cpu_start
+        stage["calls"] += 1
+
+        stop.set()
+        sampler.join()
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(state["peak"], peak - state["overhead"]) - traced_at_start
+
+        # Use the end of the stage if it holds more than the sampled snapshot
+        peak_snapshot = state["snapshot"]
+        state["snapshot"] = None
+        if peak_snapshot is None or current - state["overhead"] >= state["size"]:
+            peak_snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+        if peak >= stage["peak"]:
+            stage["peak"] = peak
+            stage["allocations"] = Counter()
+            for stat in peak_snapshot.compare_to(before, "lineno"):
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    stage["allocations"][f"{frame.filename}:{frame.lineno}"] += stat.size_diff
+
+
+def disable_profiling():
+    """
+    Stop the profiling session and write its reports.
+
+    For every stage a `<stage>.pstats` file is written (open it with
+    `pstats` or snakeviz), and `summary.txt` lists the calls, wall time,
+    CPU time, peak memory (traced memory above what was already allocated
+    when the stage started) and the top allocation sites held at that peak.
+
+    Args:
+        None
+
+    Returns:
+        str | None: Path of the summary file, or None if profiling was
+        not enabled.
+    """
+    global _SESSION
+    if _SESSION is None:
+        return None
+
+    session, _SESSION = _SESSION, None
+    output_dir = session["output_dir"]
+
+    if session["started_tracemalloc"]:
+        tracemalloc.stop()
+
+    lines = [f"{'Stage':<16}{'Calls':>8}{'Wall (s)':>12}{'CPU (s)':>12}{'Stage peak (KiB)':>18}"]
+    for name, stage in session["stages"].items():
+        stage["profiler"].dump_stats(os.path.join(output_dir, f"{name}.pstats"))
+        lines.append(
+            f"{name:<16}{stage['calls']:>8}{stage['wall']:>12.3f}"
+            f"{stage['cpu']:>12.3f}{stage['peak'] / 1024:>18.1f}"
+        )
+
+    for name, stage in session["stages"].items():
+        lines.append("")
+        lines.append(f"Top {session['top_n']} allocation sites at the peak of {name}:")
+        for site, size in stage["allocations"].most_common(session["top_n"]):
+            lines.append(f"  {size / 1024:>10.1f} KiB  {site}")
+
+    summary_file = os.path.join(output_dir, "summary.txt")
+    with open(summary_file, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print("\n".join(lines))
+    return summary_file
@@ -0,0 +1,208 @@
+import fcntl
+import json
+import os
+import random
+import threading
+import time
+import datetime
+
+# Prevents two ETL runs from overlapping inside the same process (see
+# `lock_file` in run_once for overlap across processes)
+_RUN_LOCK = threading.Lock()
+
+# Status of the most recent scheduled run
+_STATUS = {
+    "runs": 0,
+    "running": False,
+    "last_started": None,
+    "last_finished": None,
+    "last_duration": None,
+    "last_success": None,
+    "last_error": None,
+}
+
+
+def get_status():
+    """
+    Return a snapshot of the scheduler status.
+
+    Args:
+        None
+
+    Returns:
+        dict: Number of runs, whether a run is in progress, and the start
+        time, finish time, duration (seconds), success flag and error of
+        the last run.
+    """
+    return dict(_STATUS)
+
+
+def write_status(status_file):
+    """
+    Write the scheduler status to a JSON file so other processes can read it.
+
+    The file is replaced atomically, so readers never see a partial write.
+
+    Args:
+        status_file (str): Path to the JSON status file.
+
+    Returns:
+        None
+    """
+    try:
+        tmp_file = f"{status_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(get_status(), f, indent=2, default=str)
+        os.replace(tmp_file, status_file)
+
+    except Exception as e:
+        print(f"[ERROR] Failed to write scheduler status: {e}")
+
+
+def acquire_file_lock(lock_file):
+    """
+    Take an exclusive OS-level lock on a lock file without waiting.
+
+    The lock is held by the open file and released by `release_file_lock`
+    or automatically by the OS when the process exits, so a crashed run
+    never leaves a stale lock behind.
+
+    Args:
+        lock_file (str): Path to the lock file (created if missing).
+
+    Returns:
+        file | None: The open lock file if the lock was taken, or None if
+        another process (e.g. a second daemon or a cron run) holds it.
+    """
+    handle = open(lock_file, "a")
+    try:
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return handle
+
+    except OSError:
+        handle.close()
+        return None
+
+
+def release_file_lock(handle):
+    """
+    Release a lock taken with `acquire_file_lock`.
+
+    Args:
+        handle (file): The open lock file.
+
+    Returns:
+        None
+    """
+    fcntl.flock(handle, fcntl.LOCK_UN)
+    handle.close()
+
+
+def run_once(job, status_file=None, lock_file=None):
+    """
+    Run the job once, unless another run is still in progress.
+
+    With `lock_file`, runs are also serialized across processes, so a
+    second daemon or a leftover cron entry working on the same files
+    skips its run instead of overlapping.
+
+    The job is considered successful unless it raises or returns False.
+
+    Args:
+        job (callable): The function to run (e.g. `main`).
+        status_file (str | None, optional): If given, the status is written
+            to this JSON file when the run starts and when it finishes.
+            Defaults to None.
+        lock_file (str | None, optional): Lock file shared by every process
+            running the pipeline. Defaults to None (in-process lock only).
+
+    Returns:
+        bool: True if the job ran, False if it was skipped because a
+        previous run has not finished yet.
+    """
+    if not _RUN_LOCK.acquire(blocking=False):
+        print("[WARN] Previous ETL run is still in progress, skipping this run")
+        return False
+
+    lock_handle = None
+    if lock_file:
+        lock_handle = acquire_file_lock(lock_file)
+        if lock_handle is None:
+            _RUN_LOCK.release()
+            print(f"[WARN] Another process holds {lock_file}, skipping this run")
+            return False
+
+    try:
+        _STATUS["running"] = True
+        _STATUS["last_started"] = datetime.datetime.now()
+        if status_file:
+            write_status(status_file)
+        start = time.perf_counter()
+
+        try:
+            result = job()
+            _STATUS["last_success"] = result is not False
+            _STATUS["last_error"] = None
+
+        except Exception as e:
+            print(f"[ERROR] Scheduled ETL run failed: {e}")
+            _STATUS["last_success"] = False
+            _STATUS["last_error"] = str(e)
+
+        _STATUS["last_duration"] = time.perf_counter() - start
+        _STATUS["last_finished"] = datetime.datetime.now()
+        _STATUS["runs"] += 1
+
+        print(
+            f"ETL run #{_STATUS['runs']} finished in {_STATUS['last_duration']:.2f}s "
+            f"(success: {_STATUS['last_success']})"
+        )
+        return True
+
+    finally:
+        _STATUS["running"] = False
+        if status_file:
+            write_status(status_file)
+        if lock_handle:
+            release_file_lock(lock_handle)
+        _RUN_LOCK.release()
+
+
+def run_scheduler(job, interval, jitter=0, max_runs=None, sleep=time.sleep, status_file=None, lock_file=None):
+    """
+    Run the job repeatedly in the current (long-running) process.
+
+    Each run starts `interval` seconds after the previous one started,
+    plus a random delay of up to `jitter` seconds. If a run takes longer
+    than the interval, the next one starts right after it finishes, so
+    runs never overlap or pile up. Module-level resources such as the
+    HTTP session, database engine and Sheets client stay warm between runs.
+
+    Args:
+        job (callable): The function to run (e.g. `main`).
+        interval (float): Seconds between the start of consecutive runs.
+        jitter (float, optional): Maximum random delay in seconds added
+            to each interval. Defaults to 0.
+        max_runs (int | None, optional): Stop after this many runs.
+            Defaults to None (run forever).
+        sleep (callable, optional): Function used to wait. Defaults to
+            `time.sleep`.
+        status_file (str | None, optional): JSON file the status is written
+            to on every run. Defaults to None.
+        lock_file (str | None, optional): Lock file shared with other
+            processes running the pipeline. Defaults to None.
+
+    Returns:
+        None
+    """
+    runs = 0
+    while max_runs is None or runs < max_runs:
+        started = time.monotonic()
+        run_once(job, status_file, lock_file)
+        runs += 1
+
+        if max_runs is not None and runs >= max_runs:
+            break
+
+        next_start = started + interval + random.uniform(0, jitter)
+        sleep(max(0, next_start - time.monotonic()))
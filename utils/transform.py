@@ -1,11 +1,27 @@
+import gc
+import os
+import itertools
+import numpy as np
 import pandas as pd
 
+# Columns that identify a product's content (Timestamp differs on every scrape)
+CONTENT_COLUMNS = ["Title", "Price", "Rating", "Colors", "Size", "Gender"]
+
+# Chunked transform settings
+DEFAULT_CHUNK_SIZE = 50_000
+PROBE_ROWS = 1_000
+TRANSFORM_OVERHEAD = 4  # peak memory of transform_data relative to its input chunk
+
 def transform_to_DataFrame(data):
     """
     Convert raw scraped data into a pandas DataFrame.
 
+    Accepts either a list of per-product dictionaries or a columnar
+    batch (column name to list of values) from `scrape_fashion_columns`,
+    which is turned into a frame column by column.
+
     Args:
-        data (list[dict]): List of product data in dictionary format.
+        data (list[dict] | dict[str, list]): Scraped product data.
 
     Returns:
         pd.DataFrame: DataFrame containing the product data.
@@ -22,6 +38,103 @@ def transform_to_DataFrame(data):
         return None
 
 
+def hash_products(data, columns=CONTENT_COLUMNS):
+    """
+    Hash the content columns of each row into a fixed-width 64-bit key.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing product data.
+        columns (list[str], optional): Columns included in the key.
+            Defaults to CONTENT_COLUMNS.
+
+    Returns:
+        np.ndarray: Array of uint64 keys, one per row.
+    """
+    return pd.util.hash_pandas_object(data[columns], index=False).to_numpy(dtype=np.uint64)
+
+
+def load_key_index(index_file):
+    """
+    Load the persistent product key index from disk.
+
+    Args:
+        index_file (str): Path to the .npy file holding known keys.
+
+    Returns:
+        np.ndarray: Sorted array of uint64 keys (empty if the file does not exist).
+    """
+    if not os.path.exists(index_file):
+        return np.empty(0, dtype=np.uint64)
+
+    return np.load(index_file).astype(np.uint64, copy=False)
+
+
+def save_key_index(keys, index_file):
+    """
+    Write the product key index to disk, replacing the previous file atomically.
+
+    Args:
+        keys (np.ndarray): Array of uint64 keys to store.
+        index_file (str): Path to the .npy file.
+
+    Returns:
+        None
+    """
+    tmp_file = f"{index_file}.tmp"
+    with open(tmp_file, "wb") as f:
+        np.save(f, np.unique(keys))
+    os.replace(tmp_file, index_file)
+
+
+def append_key_index(keys, index_file):
+    """
+    Add keys to the persistent product key index.
+
+    Args:
+        keys (np.ndarray): Array of uint64 keys to add.
+        index_file (str): Path to the .npy file.
+
+    Returns:
+        None
+    """
+    save_key_index(np.concatenate([load_key_index(index_file), keys]), index_file)
+
+
+def deduplicate_products(data, index_file=None):
+    """
+    Drop repeated products based on a hash of their content columns.
+
+    Rows are first deduplicated within the batch. If `index_file` is given,
+    rows whose key was already seen in a previous run are dropped as well.
+    The index itself is not updated here: pass the returned keys to
+    `append_key_index` once the products have been loaded successfully.
+
+    Args:
+        data (pd.DataFrame): DataFrame containing product data.
+        index_file (str | None, optional): Path to the persistent key
+            index. Defaults to None (only in-batch deduplication).
+
+    Returns:
+        tuple[pd.DataFrame | None, np.ndarray | None]: DataFrame without
+        repeated products and the keys of its rows, or (None, None) if an
+        error occurs.
+    """
+    try:
+        keys = hash_products(data)
+
+        # Keep the first occurrence of each key within the batch
+        mask = ~pd.Series(keys).duplicated().to_numpy()
+
+        if index_file:
+            mask &= ~np.isin(keys, load_key_index(index_file))
+
+        return data[mask], keys[mask]
+
+    except Exception as e:
+        print(f"[ERROR] Failed to deduplicate data: {e}")
+        return None, None
+
+
 def transform_data(data, exchange_rate):
     """
     Clean and transform the product DataFrame.
@@ -44,12 +157,11 @@ def transform_data(data, exchange_rate):
         or None if an error occurs.
     """
     try:
-        # Remove duplicate rows
-        data = data.drop_duplicates()
+        # Remove duplicate rows (Timestamp is ignored, it differs per product)
+        data = data[~pd.Series(hash_products(data), index=data.index).duplicated()]
 
         # Filter out rows with invalid title and price
-        data = data[data["Title"] != "Unknown Product"].copy()
-        data = data[data["Price"] != "Price Unavailable"].copy()
+        data = data[(data["Title"] != "Unknown Product") & (data["Price"] != "Price Unavailable")].copy()
 
         # Clean 'Price' column: remove "$" and convert to float
         data["Price"] = data["Price"].str.replace("$", "").astype(float)
@@ -78,3 +190,158 @@ def transform_data(data, exchange_rate):
     except Exception as e:
         print(f"[ERROR] Failed to transform data: {e}")
         return None
+
+
+def iter_chunks(source, chunk_size):
+    """
+    Split raw product data into DataFrame chunks of at most `chunk_size` rows.
+
+    Args:
+        source (pd.DataFrame | dict[str, list] | Iterable[dict] | str):
+            A DataFrame, a columnar batch, a list or iterator of
+            per-product dictionaries, or the path to a CSV or Parquet
+            file (Parquet needs `pyarrow`). Files are read incrementally.
+        chunk_size (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: The next chunk of raw product data.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunk_size):
+            yield source.iloc[start:start + chunk_size]
+
+    elif isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.endswith(".parquet"):
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            try:
+                for batch in parquet_file.iter_batches(batch_size=chunk_size):
+                    yield batch.to_pandas()
+            finally:
+                parquet_file.close()
+        else:
+            with pd.read_csv(path, chunksize=chunk_size) as reader:
+                yield from reader
+
+    elif isinstance(source, dict):
+        num_rows = len(next(iter(source.values()), []))
+        for start in range(0, num_rows, chunk_size):
+            yield pd.DataFrame({name: values[start:start + chunk_size] for name, values in source.items()})
+
+    else:
+        rows = iter(source)
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            yield pd.DataFrame(chunk)
+
+
+def chunk_size_for_budget(sample, memory_budget):
+    """
+    Estimate how many rows fit in one chunk under a memory budget.
+
+    Args:
+        sample (pd.DataFrame | None): A sample of the raw input.
+        memory_budget (int): Memory budget in bytes for one chunk.
+
+    Returns:
+        int: Number of rows per chunk (at least 1).
+    """
+    if sample is None or sample.empty:
+        return DEFAULT_CHUNK_SIZE
+
+    bytes_per_row = sample.memory_usage(index=True, deep=True).sum() / len(sample)
+    return max(1, int(memory_budget / (bytes_per_row * TRANSFORM_OVERHEAD)))
+
+
+def transform_chunks(source, exchange_rate, chunk_size=None, memory_budget=None):
+    """
+    Transform product data chunk by chunk, keeping peak memory constant.
+
+    Only one raw chunk and its transformed result are held in memory at a
+    time. If `chunk_size` is not given, it is derived from `memory_budget`
+    using a sample of the input. Duplicates are removed within each chunk;
+    use `deduplicate_products` with an index file to drop them across chunks.
+    Chunks that fail to transform are skipped (the error is printed).
+
+    Args:
+        source (pd.DataFrame | dict[str, list] | Iterable[dict] | str):
+            Raw product data, see `iter_chunks`.
+        exchange_rate (float): The exchange rate to convert USD to IDR.
+        chunk_size (int | None, optional): Rows per chunk. Defaults to None.
+        memory_budget (int | None, optional): Memory budget in bytes for one
+            chunk, used when `chunk_size` is None. Defaults to None
+            (DEFAULT_CHUNK_SIZE rows).
+
+    Yields:
+        pd.DataFrame: The next transformed chunk.
+    """
+    if chunk_size is None:
+        if memory_budget is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+        elif isinstance(source, (pd.DataFrame, dict, list, tuple, str, os.PathLike)):
+            # Close the probe right away so its file reader is released
+            probe = iter_chunks(source, PROBE_ROWS)
+            try:
+                chunk_size = chunk_size_for_budget(next(probe, None), memory_budget)
+            finally:
+                probe.close()
+        else:
+            # Iterators can only be read once, so put the sample back in front
+            source = iter(source)
+            sample = list(itertools.islice(source, PROBE_ROWS))
+            chunk_size = chunk_size_for_budget(pd.DataFrame(sample), memory_budget)
+            source = itertools.chain(sample, source)
+
+    for chunk in iter_chunks(source, chunk_size):
+        transformed = transform_data(chunk, exchange_rate)
+        del chunk
+
+        # Intermediate pandas objects form reference cycles; free them now so
+        # garbage from earlier chunks does not pile up and raise the peak
+        gc.collect()
+
+        if transformed is not None:
+            yield transformed
+
+
+def spill_chunks(chunks, spill_dir):
+    """
+    Write transformed chunks to disk so they can be loaded several times.
+
+    Each chunk is pickled to its own file and released from memory, so
+    every loader can later read the results one chunk at a time.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): Transformed chunks.
+        spill_dir (str): Directory to write the chunk files to.
+
+    Returns:
+        list[str]: Paths of the written chunk files, in order.
+    """
+    os.makedirs(spill_dir, exist_ok=True)
+
+    paths = []
+    for number, chunk in enumerate(chunks):
+        path = os.path.join(spill_dir, f"chunk_{number:06d}.pkl")
+        chunk.to_pickle(path)
+        paths.append(path)
+
+    return paths
+
+
+def read_spilled_chunks(paths):
+    """
+    Read spilled chunks back one at a time.
+
+    Args:
+        paths (list[str]): Paths returned by `spill_chunks`.
+
+    Yields:
+        pd.DataFrame: The next transformed chunk.
+    """
+    for path in paths:
+        yield pd.read_pickle(path)